@@ -6,6 +6,7 @@ common functionality, and standardized interfaces.
 """
 
 import asyncio
+import json
 import time
 import uuid
 from abc import ABC, abstractmethod
@@ -21,6 +22,13 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     Anthropic = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from ..core.exceptions import (
     AgentSDKError,
     TaskExecutionError,
@@ -32,6 +40,17 @@ from ..core.context_manager import AgentContext
 from ..core.task_orchestrator import TaskResult
 
 
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as two-space indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects non-string keys and integers beyond 64 bits
+            pass
+    return json.dumps(obj, indent=2)
+
+
 class AgentStatus(Enum):
     """Agent operational status."""
     OFFLINE = "offline"
@@ -7,10 +7,18 @@ security scanning, performance analysis, and architecture review.
 
 import asyncio
 import json
+import mmap
+import multiprocessing
+import os
 import ast
+import re
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
 from datetime import datetime
+from dataclasses import dataclass, field
 
 from .base_agent import BaseAgent, TaskResult
 from ..core.rules_engine import TaskSpec
@@ -18,6 +26,571 @@ from ..core.context_manager import AgentContext
 from ..core.exceptions import TaskExecutionError, MCPServerError
 
 
+# Per-finding score penalties used by the static analysis reports
+_SEV_WEIGHTS_SECURITY = {"CRITICAL": 0.2, "HIGH": 0.1, "MEDIUM": 0.05, "LOW": 0.0}
+_SEV_WEIGHTS_PERF = {"CRITICAL": 0.15, "HIGH": 0.08, "MEDIUM": 0.04, "LOW": 0.0}
+_SEV_WEIGHTS_COUPLING = {"CRITICAL": 0.05, "HIGH": 0.2, "MEDIUM": 0.1, "LOW": 0.05}
+_SEV_WEIGHTS_ARCHITECTURE = {"CRITICAL": 0.05, "HIGH": 0.15, "MEDIUM": 0.1, "LOW": 0.05}
+
+# Line-level security vulnerability patterns, compiled once at import
+_SECURITY_RULES = tuple(
+    (re.compile(pattern, re.IGNORECASE), info)
+    for pattern, info in {
+        r'eval\s*\(': {"type": "code_injection", "severity": "CRITICAL", "description": "Use of eval() function allows code injection"},
+        r'exec\s*\(': {"type": "code_injection", "severity": "CRITICAL", "description": "Use of exec() function allows code injection"},
+        r'shell=True': {"type": "command_injection", "severity": "HIGH", "description": "shell=True in subprocess calls can lead to command injection"},
+        r'os\.system\s*\(': {"type": "command_injection", "severity": "HIGH", "description": "os.system() can lead to command injection"},
+        r'subprocess\.call.*shell=True': {"type": "command_injection", "severity": "HIGH", "description": "subprocess with shell=True is vulnerable to injection"},
+        r'pickle\.loads?\s*\(': {"type": "deserialization", "severity": "HIGH", "description": "Pickle deserialization can execute arbitrary code"},
+        r'marshal\.loads?\s*\(': {"type": "deserialization", "severity": "HIGH", "description": "Marshal deserialization can execute arbitrary code"},
+        r'random\.random\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "random.random() is not cryptographically secure"},
+        r'md5\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "MD5 is cryptographically weak"},
+        r'sha1\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "SHA1 is cryptographically weak"},
+        r'password\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded password detected"},
+        r'api_key\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded API key detected"},
+        r'secret\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded secret detected"},
+        r'token\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "MEDIUM", "description": "Hardcoded token detected"},
+        r'http://': {"type": "insecure_protocol", "severity": "MEDIUM", "description": "Insecure HTTP protocol usage"},
+        r'verify\s*=\s*False': {"type": "ssl_verification", "severity": "MEDIUM", "description": "SSL certificate verification disabled"},
+        r'sql.*\+.*%': {"type": "sql_injection", "severity": "HIGH", "description": "Potential SQL injection vulnerability"},
+        r'format.*sql.*\{': {"type": "sql_injection", "severity": "MEDIUM", "description": "Potential SQL injection via string formatting"},
+    }.items()
+)
+
+# Line-level performance bottleneck patterns, compiled once at import
+_PERFORMANCE_RULES = tuple(
+    (re.compile(pattern, re.IGNORECASE), info)
+    for pattern, info in {
+        r'\.sort\(\).*\[\d+\]': {"type": "inefficient_sorting", "severity": "MEDIUM", "description": "Sorting entire list when only top/bottom element needed"},
+        r'for.*in.*range\(len\(': {"type": "inefficient_loop", "severity": "MEDIUM", "description": "Using range(len()) pattern instead of direct iteration"},
+        r'for.*in.*\[\w+.*for.*\w+.*in.*if.*\]': {"type": "nested_loop", "severity": "HIGH", "description": "Potential O(n²) nested loop in list comprehension"},
+        r'while.*len\(.*\)': {"type": "inefficient_length_check", "severity": "MEDIUM", "description": "Repeated len() calls in loop condition"},
+        r'\.append\(.*\).*for.*in': {"type": "inefficient_building", "severity": "MEDIUM", "description": "Building list element by element in loop"},
+        r'open\(.*\).*for.*line.*in': {"type": "file_io_optimization", "severity": "MEDIUM", "description": "File I/O without context manager or buffering"},
+        r're\.search.*for.*in': {"type": "regex_optimization", "severity": "MEDIUM", "description": "Regex compilation in loop - compile once outside"},
+        r'str.*\+.*str.*for.*in': {"type": "string_concatenation", "severity": "MEDIUM", "description": "Inefficient string concatenation in loop"},
+        r'list\(dict\.keys\(\)\)': {"type": "unnecessary_conversion", "severity": "LOW", "description": "Unnecessary list() conversion of dict.keys()"},
+        r'dict\.has_key\(.*\)': {"type": "deprecated_method", "severity": "LOW", "description": "Deprecated dict.has_key() method"},
+        r'time\.sleep\(\d+\)': {"type": "blocking_sleep", "severity": "MEDIUM", "description": "Blocking sleep call - consider async alternatives"},
+        r'threads\.Thread': {"type": "threading_without_pool", "severity": "MEDIUM", "description": "Manual thread creation - consider thread pool"},
+        r'multiprocessing\.Process': {"type": "process_without_pool", "severity": "MEDIUM", "description": "Manual process creation - consider process pool"},
+        r'global\s+\w+': {"type": "global_variable", "severity": "LOW", "description": "Global variable usage may impact performance"},
+        r'exec\(': {"type": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution is slow and unsafe"},
+        r'eval\(': {"type": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution is slow and unsafe"},
+        r'import\s+\*': {"type": "wildcard_import", "severity": "LOW", "description": "Wildcard imports can impact startup time"},
+    }.items()
+)
+
+# Line-level architecture pattern indicators, compiled once at import
+_ARCHITECTURE_PATTERNS = {
+    r'class.*\(.*\).*:.*\n.*def __init__': {"type": "class_pattern", "pattern": "basic_class", "severity": "LOW"},
+    r'class.*\(.*ABC.*\)': {"type": "design_pattern", "pattern": "abstract_base", "severity": "LOW"},
+    r'@.*decorator': {"type": "design_pattern", "pattern": "decorator", "severity": "LOW"},
+    r'class.*\(.*Singleton.*\)': {"type": "design_pattern", "pattern": "singleton", "severity": "MEDIUM"},
+    r'class.*Factory': {"type": "design_pattern", "pattern": "factory", "severity": "LOW"},
+    r'class.*Observer': {"type": "design_pattern", "pattern": "observer", "severity": "LOW"},
+    r'class.*\(.*metaclass.*\)': {"type": "design_pattern", "pattern": "metaclass", "severity": "MEDIUM"},
+    r'from.*import.*\*': {"type": "coupling_issue", "pattern": "tight_coupling", "severity": "MEDIUM", "description": "Wildcard import creates tight coupling"},
+    r'global\s+\w+': {"type": "coupling_issue", "pattern": "global_state", "severity": "HIGH", "description": "Global variable creates hidden dependencies"},
+    r'eval\(|exec\(': {"type": "architecture_issue", "pattern": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution complicates static analysis"},
+    r'getattr\(|setattr\(|hasattr\(': {"type": "architecture_issue", "pattern": "dynamic_attributes", "severity": "MEDIUM", "description": "Dynamic attribute access reduces type safety"},
+    r'__import__\(|importlib\.import_module': {"type": "architecture_issue", "pattern": "dynamic_import", "severity": "MEDIUM", "description": "Dynamic imports complicate dependency analysis"},
+    r'type\(': {"type": "architecture_issue", "pattern": "type_checking", "severity": "LOW", "description": "Runtime type checking may indicate design issues"},
+    r'isinstance\(\s*\w+\s*,\s*\(': {"type": "architecture_issue", "pattern": "type_checking", "severity": "LOW", "description": "Runtime type checking may indicate design issues"},
+}
+# Rules are matched one line at a time, so patterns spanning a newline can
+# never fire and are left out
+_LINE_PATTERNS = [pattern for pattern in _ARCHITECTURE_PATTERNS if r'\n' not in pattern]
+_ARCHITECTURE_RULES = tuple(
+    (
+        _ARCHITECTURE_PATTERNS[pattern]["type"],
+        _ARCHITECTURE_PATTERNS[pattern]["pattern"],
+        _ARCHITECTURE_PATTERNS[pattern]["severity"],
+        _ARCHITECTURE_PATTERNS[pattern].get("description")
+    )
+    for pattern in _LINE_PATTERNS
+)
+_ARCHITECTURE_SEARCHES = tuple(re.compile(pattern, re.IGNORECASE).search for pattern in _LINE_PATTERNS)
+# Case-sensitive twins for lowercased ASCII text, where they find the same
+# matches without the cost of IGNORECASE matching
+_ARCHITECTURE_SEARCHES_LOWER = tuple(re.compile(pattern.lower()).search for pattern in _LINE_PATTERNS)
+
+# Caps on pattern findings reported for a single file
+_MAX_FINDINGS_PER_RULE = 50
+_MAX_FINDINGS_PER_FILE = 500
+
+# Names flagged by the AST security pass
+_DANGEROUS_CALLS = frozenset({"eval", "exec"})
+_SERIALIZER_METHODS = frozenset({"loads", "dumps"})
+_UNSAFE_DESERIALIZERS = frozenset({"pickle", "marshal"})
+_DANGEROUS_IMPORTS = frozenset({"pickle", "marshal"})
+
+# Static sections of the architecture report
+_ARCHITECTURE_RECOMMENDATIONS = """
+## Architectural Improvement Recommendations
+
+### 1. SOLID Principles Implementation
+- **Single Responsibility**: Ensure classes have only one reason to change
+- **Open/Closed**: Design for extension, not modification
+- **Liskov Substitution**: Subtypes must be substitutable for base types
+- **Interface Segregation**: Prefer small, focused interfaces
+- **Dependency Inversion**: Depend on abstractions, not concretions
+
+### 2. Design Patterns to Consider
+- **Factory Pattern**: For object creation with complex logic
+- **Observer Pattern**: For event-driven architectures
+- **Strategy Pattern**: For algorithm selection and variation
+- **Command Pattern**: For encapsulating requests as objects
+- **Decorator Pattern**: For adding behavior dynamically
+
+### 3. Architectural Refactoring Opportunities
+- Extract common functionality into shared services
+- Implement proper dependency injection
+- Reduce global state and side effects
+- Improve separation of concerns between layers
+- Consider microservices architecture for large applications
+
+### 4. Code Organization Improvements
+- Group related functionality into cohesive modules
+- Implement clear package boundaries
+- Use consistent naming conventions
+- Establish clear architectural layers
+- Document architectural decisions and rationale
+
+"""
+_ARCHITECTURE_NEXT_STEPS = """
+## Next Steps
+1. Address all critical and high-priority architectural issues
+2. Implement identified design patterns where appropriate
+3. Refactor to improve SOLID principles adherence
+4. Establish architectural review process
+5. Document architectural decisions and patterns
+
+*Report generated via static code analysis and architectural pattern detection*
+"""
+
+# Issues listed per severity in the architecture report
+_REPORTED_ISSUE_LIMITS = {"CRITICAL": 5, "HIGH": 10}
+
+# Per-issue section of the architecture report
+_ARCHITECTURE_ISSUE_TEMPLATE = """
+### {title} - {level}
+**File**: {issue.file}:{issue.line}
+**Description**: {description}
+**Code**: `{issue.code}`
+
+**Recommendation**: {recommendation}
+"""
+
+# Files larger than this are memory-mapped instead of read into a buffer
+_MMAP_THRESHOLD = 64 * 1024
+
+# Fewest stale files worth shipping to the process pool; smaller batches run inline
+_MIN_POOL_BATCH = 8
+
+# Directories never descended into when collecting source files
+_SKIPPED_DIRS = frozenset({".git", "node_modules", "venv", ".venv", "__pycache__", "dist", "build"})
+
+# Substrings a file must contain before the AST passes can report anything
+_AST_SECURITY_MARKERS = ("eval", "exec", "pickle", "marshal")
+_AST_ARCHITECTURE_MARKERS = ("class", "def")
+
+# Import statements, for files whose imports are collected without parsing
+_IMPORT_LINE = re.compile(r'^[ \t]*(?:from[ \t]+\.*([\w.]*)[ \t]+import\b|import[ \t]+([^\n#;]+))', re.MULTILINE)
+
+
+@dataclass(slots=True)
+class Finding:
+    """Single issue reported by the static security/performance scanners."""
+    file: str
+    line: int
+    type: str
+    severity: str
+    description: str
+    code: str
+
+
+@dataclass(slots=True)
+class ArchitectureFinding:
+    """Single issue or design pattern reported by the static architecture scanner."""
+    file: str
+    line: int
+    type: str
+    pattern: str
+    severity: str
+    code: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ImportGraph:
+    """File to imported-module adjacency in CSR form over interned module ids."""
+    module_ids: Dict[str, int] = field(default_factory=dict)
+    file_ids: Dict[str, int] = field(default_factory=dict)
+    indptr: array = field(default_factory=lambda: array('i', [0]))
+    indices: array = field(default_factory=lambda: array('i'))
+
+    def add_file(self, file: str, modules: Iterable[str]):
+        """Record the modules imported by one file; each module name is stored once."""
+        module_ids = self.module_ids
+        self.file_ids[file] = len(self.file_ids)
+        self.indices.extend(module_ids.setdefault(module, len(module_ids)) for module in modules)
+        self.indptr.append(len(self.indices))
+
+    def edge_count(self) -> int:
+        """Total number of file to module import edges."""
+        return len(self.indices)
+
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """Collect AST-level security findings for a single file."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.findings: List[Finding] = []
+
+    def visit_Call(self, node: ast.Call):
+        # Check for dangerous function calls
+        func = node.func
+        if isinstance(func, ast.Name):
+            if func.id in _DANGEROUS_CALLS:
+                self.findings.append(Finding(
+                    file=self.file_path,
+                    line=node.lineno,
+                    type="code_injection",
+                    severity="CRITICAL",
+                    description=f"Dangerous function call: {func.id}()",
+                    code=f"{func.id}(...)"
+                ))
+        elif isinstance(func, ast.Attribute):
+            if func.attr in _SERIALIZER_METHODS and isinstance(func.value, ast.Name):
+                if func.value.id in _UNSAFE_DESERIALIZERS:
+                    self.findings.append(Finding(
+                        file=self.file_path,
+                        line=node.lineno,
+                        type="deserialization",
+                        severity="HIGH",
+                        description=f"Unsafe deserialization using {func.value.id}.{func.attr}",
+                        code=f"{func.value.id}.{func.attr}(...)"
+                    ))
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        # Check for imports of dangerous modules
+        for alias in node.names:
+            if alias.name in _DANGEROUS_IMPORTS:
+                self.findings.append(Finding(
+                    file=self.file_path,
+                    line=node.lineno,
+                    type="dangerous_import",
+                    severity="MEDIUM",
+                    description=f"Import of potentially dangerous module: {alias.name}",
+                    code=f"import {alias.name}"
+                ))
+
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """Accumulate computational complexity metrics for a single file."""
+
+    EXPENSIVE_CALLS = frozenset({"sorted", "sort", "max", "min", "sum", "any", "all"})
+
+    def __init__(self, complexity_data: Dict[str, Any]):
+        self.complexity_data = complexity_data
+        self._loop_depth = 0
+        self._function_names: List[str] = []
+
+    def _visit_loop(self, node: ast.AST):
+        self.complexity_data["complexity"] += 1
+        # Nested loops add their enclosing loop depth
+        if self._loop_depth > 0:
+            self.complexity_data["nested_loops"] += 1
+            self.complexity_data["complexity"] += self._loop_depth
+        self._loop_depth += 1
+        self.generic_visit(node)
+        self._loop_depth -= 1
+
+    visit_For = _visit_loop
+    visit_While = _visit_loop
+
+    def _visit_comprehension(self, node: ast.AST):
+        self.complexity_data["complexity"] += 1
+        self.generic_visit(node)
+
+    visit_DictComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+
+    def visit_ListComp(self, node: ast.ListComp):
+        self.complexity_data["list_comprehensions"] += 1
+        self._visit_comprehension(node)
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp):
+        self.complexity_data["generators"] += 1
+        self.complexity_data["complexity"] += 0.3
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        self.complexity_data["function_calls"] += 1
+        if isinstance(node.func, ast.Name):
+            # Check for potentially expensive function calls
+            if node.func.id in self.EXPENSIVE_CALLS:
+                self.complexity_data["complexity"] += 0.5
+            # Check for recursion in every enclosing function of that name
+            for name in self._function_names:
+                if name == node.func.id:
+                    self.complexity_data["recursive_calls"] += 1
+                    self.complexity_data["complexity"] += 2
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._function_names.append(node.name)
+        self.generic_visit(node)
+        self._function_names.pop()
+
+
+class _ArchitectureVisitor(ast.NodeVisitor):
+    """Collect architecture findings, class/function info and imports for a single file."""
+
+    # Definitions and imports only occur in statement lists, so the walk
+    # follows these fields and never descends into expression subtrees
+    STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.findings: List[ArchitectureFinding] = []
+        self.class_info: List[Dict[str, Any]] = []
+        self.function_info: List[Dict[str, Any]] = []
+        self.imports: Set[str] = set()
+
+    def generic_visit(self, node: ast.AST):
+        for field in self.STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        # Analyze class characteristics
+        bases = [base.id if isinstance(base, ast.Name) else str(base) for base in node.bases]
+        methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
+
+        self.class_info.append({
+            "name": node.name,
+            "bases": bases,
+            "methods": methods,
+            "line": node.lineno,
+            "method_count": len(methods)
+        })
+
+        # Check for architectural issues
+        if len(methods) > 15:
+            self.findings.append(ArchitectureFinding(
+                file=self.file_path,
+                line=node.lineno,
+                type="architecture_issue",
+                pattern="large_class",
+                severity="MEDIUM",
+                code=f"class {node.name}",
+                description=f"Class {node.name} has {len(methods)} methods, may violate Single Responsibility Principle"
+            ))
+
+        # Check for God Object anti-pattern
+        if len(methods) > 10 and "object" in bases:
+            self.findings.append(ArchitectureFinding(
+                file=self.file_path,
+                line=node.lineno,
+                type="architecture_issue",
+                pattern="god_object",
+                severity="HIGH",
+                code=f"class {node.name}",
+                description=f"Class {node.name} may be a God Object anti-pattern"
+            ))
+
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # Analyze function characteristics
+        self.function_info.append({
+            "name": node.name,
+            "line": node.lineno,
+            "args_count": len(node.args.args),
+            "is_method": False
+        })
+
+        # Check for parameter count issues
+        if len(node.args.args) > 7:
+            self.findings.append(ArchitectureFinding(
+                file=self.file_path,
+                line=node.lineno,
+                type="architecture_issue",
+                pattern="too_many_parameters",
+                severity="MEDIUM",
+                code=f"def {node.name}(...)",
+                description=f"Function {node.name} has {len(node.args.args)} parameters, may need refactoring"
+            ))
+
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.add(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.imports.add(node.module)
+
+
+def _scan_architecture_patterns(content: str, file_path: str) -> List[ArchitectureFinding]:
+    """Analyze code content for architectural patterns and issues."""
+    # Lowercasing ASCII text keeps every offset, so matches found in the
+    # lowered copy map straight back onto the original content
+    if content.isascii():
+        haystack = content.lower()
+        searches = _ARCHITECTURE_SEARCHES_LOWER
+    else:
+        haystack = content
+        searches = _ARCHITECTURE_SEARCHES
+    find, rfind = haystack.find, haystack.rfind
+    end = len(haystack)
+
+    # Each rule scans the whole buffer for the next line it can match; lines
+    # in between are skipped without being searched individually. After a
+    # hit the scan resumes on the following line, so a match running past
+    # a newline cannot hide one that starts on the next line.
+    hits = []
+    truncated = False
+    for index, search in enumerate(searches):
+        pos = 0
+        rule_hits = 0
+        while True:
+            if rule_hits == _MAX_FINDINGS_PER_RULE:
+                # Generated or minified code can repeat a construct thousands
+                # of times; stop this rule rather than scan the rest of the file
+                if search(haystack, pos) is not None:
+                    truncated = True
+                break
+            match = search(haystack, pos)
+            if match is None:
+                break
+            start = match.start()
+            line_start = rfind('\n', 0, start) + 1
+            line_end = find('\n', start)
+            if line_end == -1:
+                line_end = end
+            # Rules apply to a single line; confirm the match fits within it
+            if search(haystack, line_start, line_end):
+                hits.append((line_start, index, line_end))
+                rule_hits += 1
+            if line_end == end:
+                break
+            pos = line_end + 1
+
+    # Report in line order, then rule order, counting newlines once
+    findings = []
+    append = findings.append
+    count = content.count
+    hits.sort()
+    if len(hits) > _MAX_FINDINGS_PER_FILE:
+        del hits[_MAX_FINDINGS_PER_FILE:]
+        truncated = True
+    pos = 0
+    line_num = 1
+    stripped = None
+    for line_start, index, line_end in hits:
+        if line_start != pos or stripped is None:
+            line_num += count('\n', pos, line_start)
+            pos = line_start
+            stripped = content[line_start:line_end].strip()
+        kind, pattern, severity, description = _ARCHITECTURE_RULES[index]
+        append(ArchitectureFinding(file_path, line_num, kind, pattern, severity, stripped, description))
+
+    if truncated:
+        append(ArchitectureFinding(
+            file=file_path,
+            line=1,
+            type="analysis_note",
+            pattern="findings_truncated",
+            severity="LOW",
+            code="",
+            description=(
+                f"Pattern findings capped at {_MAX_FINDINGS_PER_RULE} per rule "
+                f"and {_MAX_FINDINGS_PER_FILE} per file"
+            )
+        ))
+
+    return findings
+
+
+def _scan_imports(content: str) -> Set[str]:
+    """Collect imported module names line by line, as the AST visitor would."""
+    imports = set()
+    for match in _IMPORT_LINE.finditer(content):
+        from_module, names = match.groups()
+        if names is None:
+            if from_module:
+                imports.add(from_module)
+            continue
+        for name in names.split(','):
+            tokens = name.split()
+            if tokens and tokens[0] != '\\':
+                imports.add(tokens[0])
+    return imports
+
+
+def _calculate_inheritance_depth(class_info: List[Dict[str, Any]]) -> int:
+    """Calculate the longest chain of base classes defined in the same file."""
+    graph = {cls["name"]: cls["bases"] for cls in class_info}
+    depths: Dict[str, int] = {}
+
+    def depth(name: str) -> int:
+        # Memoized, so each class and base edge is visited once
+        if name not in depths:
+            # Provisional entry so cyclic or self-referencing bases terminate
+            depths[name] = 0
+            depths[name] = 1 + max((depth(base) for base in graph[name] if base in graph), default=0)
+        return depths[name]
+
+    return max((depth(name) for name in graph), default=0)
+
+
+def _analyze_architecture_file(file_path: str, content: str) -> Tuple[List[ArchitectureFinding], Optional[Set[str]]]:
+    """
+    Run the pattern and AST architecture passes over one file.
+
+    Module-level so it can be shipped to worker processes. Returns the
+    findings and the imported modules, or None for the imports when the
+    file does not parse.
+    """
+    findings = _scan_architecture_patterns(content, file_path)
+
+    # Without class or function definitions the AST pass has nothing to
+    # report, so import-only modules and stubs skip the parse entirely
+    if not any(marker in content for marker in _AST_ARCHITECTURE_MARKERS):
+        return findings, _scan_imports(content)
+
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return findings, None
+
+    # One traversal yields the AST findings and the imports for the structure analysis
+    visitor = _ArchitectureVisitor(file_path)
+    visitor.visit(tree)
+    findings.extend(visitor.findings)
+
+    # Analyze inheritance depth
+    inheritance_depth = _calculate_inheritance_depth(visitor.class_info)
+    if inheritance_depth > 4:
+        findings.append(ArchitectureFinding(
+            file=file_path,
+            line=1,
+            type="architecture_issue",
+            pattern="deep_inheritance",
+            severity="MEDIUM",
+            code="inheritance_hierarchy",
+            description=f"Inheritance depth {inheritance_depth} may be too deep"
+        ))
+
+    return findings, visitor.imports
+
+
 class CodeBaseAnalyzer(BaseAgent):
     """
     Specialized agent for code analysis with Serena MCP integration.
@@ -29,6 +602,13 @@ class CodeBaseAnalyzer(BaseAgent):
         super().__init__(agent_type="codebase_analyzer", config=config)
         self.max_files_to_analyze = self.config.get("max_files_to_analyze", 100)
         self.analysis_timeout = self.config.get("analysis_timeout", 600)
+        # Architecture passes run inline unless more workers are configured
+        self.analysis_workers = self.config.get("analysis_workers", 1)
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
+
+        # Per-file architecture results keyed by path, validated by (mtime_ns, size)
+        self.architecture_cache: OrderedDict[str, Tuple[Tuple[int, int], Tuple[List[ArchitectureFinding], Optional[Set[str]]]]] = OrderedDict()
+        self.max_cache_size = self.config.get("max_cache_size", 1000)
 
     async def _initialize_capabilities(self):
         """Initialize codebase analyzer capabilities."""
@@ -529,7 +1109,7 @@ Since direct repository access is not available, focus on general code quality p
                 return self._compute_default_quality_metrics()
 
             # Analyze Python files for quality metrics
-            python_files = list(repo_path.rglob("*.py"))
+            python_files = self._find_python_files(repo_path)
             total_files = len(python_files)
 
             if total_files == 0:
@@ -696,7 +1276,7 @@ Since direct repository access is not available, focus on general code quality p
 
             if repo_path.exists():
                 # Analyze Python files for security vulnerabilities
-                python_files = list(repo_path.rglob("*.py"))
+                python_files = self._find_python_files(repo_path)
 
                 for file_path in python_files[:30]:  # Limit for performance
                     try:
@@ -706,16 +1286,18 @@ Since direct repository access is not available, focus on general code quality p
                         # Security pattern analysis
                         findings = self._analyze_security_patterns(content, str(file_path))
                         security_findings.extend(findings)
-                        vulnerability_count += len([f for f in findings if f['severity'] in ['HIGH', 'CRITICAL']])
-
-                        # AST-based security analysis
-                        try:
-                            tree = ast.parse(content)
-                            ast_findings = self._analyze_ast_security(tree, str(file_path))
-                            security_findings.extend(ast_findings)
-                            vulnerability_count += len([f for f in ast_findings if f['severity'] in ['HIGH', 'CRITICAL']])
-                        except SyntaxError:
-                            continue
+                        vulnerability_count += len([f for f in findings if f.severity in ['HIGH', 'CRITICAL']])
+
+                        # AST-based security analysis, skipped when none of the
+                        # names it looks for appear anywhere in the source
+                        if any(marker in content for marker in _AST_SECURITY_MARKERS):
+                            try:
+                                tree = ast.parse(content)
+                                ast_findings = self._analyze_ast_security(tree, str(file_path))
+                                security_findings.extend(ast_findings)
+                                vulnerability_count += len([f for f in ast_findings if f.severity in ['HIGH', 'CRITICAL']])
+                            except SyntaxError:
+                                continue
 
                     except (UnicodeDecodeError, PermissionError):
                         continue
@@ -724,10 +1306,7 @@ Since direct repository access is not available, focus on general code quality p
             security_score = max(0.0, 1.0 - (vulnerability_count / 10.0))
 
             # Categorize findings
-            critical_issues = [f for f in security_findings if f['severity'] == 'CRITICAL']
-            high_issues = [f for f in security_findings if f['severity'] == 'HIGH']
-            medium_issues = [f for f in security_findings if f['severity'] == 'MEDIUM']
-            low_issues = [f for f in security_findings if f['severity'] == 'LOW']
+            critical_issues, high_issues, medium_issues, low_issues = self._partition_by_severity(security_findings)
 
             # Build comprehensive security report
             analysis_report = self._build_security_analysis_report(
@@ -771,100 +1350,57 @@ Since direct repository access is not available, focus on general code quality p
                 }
             )
 
-    def _analyze_security_patterns(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_security_patterns(self, content: str, file_path: str) -> List[Finding]:
         """Analyze code content for security vulnerability patterns."""
         findings = []
 
-        # Security vulnerability patterns
-        security_patterns = {
-            r'eval\s*\(': {"type": "code_injection", "severity": "CRITICAL", "description": "Use of eval() function allows code injection"},
-            r'exec\s*\(': {"type": "code_injection", "severity": "CRITICAL", "description": "Use of exec() function allows code injection"},
-            r'shell=True': {"type": "command_injection", "severity": "HIGH", "description": "shell=True in subprocess calls can lead to command injection"},
-            r'os\.system\s*\(': {"type": "command_injection", "severity": "HIGH", "description": "os.system() can lead to command injection"},
-            r'subprocess\.call.*shell=True': {"type": "command_injection", "severity": "HIGH", "description": "subprocess with shell=True is vulnerable to injection"},
-            r'pickle\.loads?\s*\(': {"type": "deserialization", "severity": "HIGH", "description": "Pickle deserialization can execute arbitrary code"},
-            r'marshal\.loads?\s*\(': {"type": "deserialization", "severity": "HIGH", "description": "Marshal deserialization can execute arbitrary code"},
-            r'random\.random\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "random.random() is not cryptographically secure"},
-            r'md5\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "MD5 is cryptographically weak"},
-            r'sha1\s*\(': {"type": "weak_crypto", "severity": "MEDIUM", "description": "SHA1 is cryptographically weak"},
-            r'password\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded password detected"},
-            r'api_key\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded API key detected"},
-            r'secret\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "HIGH", "description": "Hardcoded secret detected"},
-            r'token\s*=\s*["\'][^"\']+["\']': {"type": "hardcoded_secret", "severity": "MEDIUM", "description": "Hardcoded token detected"},
-            r'http://': {"type": "insecure_protocol", "severity": "MEDIUM", "description": "Insecure HTTP protocol usage"},
-            r'verify\s*=\s*False': {"type": "ssl_verification", "severity": "MEDIUM", "description": "SSL certificate verification disabled"},
-            r'sql.*\+.*%': {"type": "sql_injection", "severity": "HIGH", "description": "Potential SQL injection vulnerability"},
-            r'format.*sql.*\{': {"type": "sql_injection", "severity": "MEDIUM", "description": "Potential SQL injection via string formatting"},
-        }
-
         lines = content.split('\n')
         for line_num, line in enumerate(lines, 1):
-            for pattern, info in security_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    findings.append({
-                        "file": file_path,
-                        "line": line_num,
-                        "type": info["type"],
-                        "severity": info["severity"],
-                        "description": info["description"],
-                        "code": line.strip()
-                    })
+            stripped = None
+            for pattern, info in _SECURITY_RULES:
+                if pattern.search(line):
+                    if stripped is None:
+                        stripped = line.strip()
+                    findings.append(Finding(
+                        file=file_path,
+                        line=line_num,
+                        type=info["type"],
+                        severity=info["severity"],
+                        description=info["description"],
+                        code=stripped
+                    ))
 
         return findings
 
-    def _analyze_ast_security(self, tree: ast.AST, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_ast_security(self, tree: ast.AST, file_path: str) -> List[Finding]:
         """Analyze AST for security vulnerabilities."""
-        findings = []
+        visitor = _SecurityVisitor(file_path)
+        visitor.visit(tree)
+        return visitor.findings
 
-        for node in ast.walk(tree):
-            # Check for dangerous function calls
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in ['eval', 'exec']:
-                        findings.append({
-                            "file": file_path,
-                            "line": node.lineno,
-                            "type": "code_injection",
-                            "severity": "CRITICAL",
-                            "description": f"Dangerous function call: {node.func.id}()",
-                            "code": f"{node.func.id}(...)"
-                        })
-                elif isinstance(node.func, ast.Attribute):
-                    if node.func.attr in ['loads', 'dumps']:
-                        if isinstance(node.func.value, ast.Name):
-                            if node.func.value.id in ['pickle', 'marshal']:
-                                findings.append({
-                                    "file": file_path,
-                                    "line": node.lineno,
-                                    "type": "deserialization",
-                                    "severity": "HIGH",
-                                    "description": f"Unsafe deserialization using {node.func.value.id}.{node.func.attr}",
-                                    "code": f"{node.func.value.id}.{node.func.attr}(...)"
-                                })
-
-            # Check for imports of dangerous modules
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name in ['pickle', 'marshal']:
-                        findings.append({
-                            "file": file_path,
-                            "line": node.lineno,
-                            "type": "dangerous_import",
-                            "severity": "MEDIUM",
-                            "description": f"Import of potentially dangerous module: {alias.name}",
-                            "code": f"import {alias.name}"
-                        })
+    def _partition_by_severity(
+        self,
+        findings: List[Finding]
+    ) -> Tuple[List[Finding], List[Finding], List[Finding], List[Finding]]:
+        """Split findings into (critical, high, medium, low) lists in a single pass."""
+        buckets = {"CRITICAL": [], "HIGH": [], "MEDIUM": [], "LOW": []}
+        for finding in findings:
+            buckets[finding.severity].append(finding)
 
-        return findings
+        return buckets["CRITICAL"], buckets["HIGH"], buckets["MEDIUM"], buckets["LOW"]
+
+    def _severity_score(self, findings: List[Finding], weights: Dict[str, float]) -> float:
+        """Score findings as 1.0 minus their summed severity weights, floored at 0.0."""
+        return max(0.0, 1.0 - sum(weights[f.severity] for f in findings))
 
     def _build_security_analysis_report(
         self,
         repository_path: str,
-        findings: List[Dict[str, Any]],
-        critical: List[Dict[str, Any]],
-        high: List[Dict[str, Any]],
-        medium: List[Dict[str, Any]],
-        low: List[Dict[str, Any]]
+        findings: List[Finding],
+        critical: List[Finding],
+        high: List[Finding],
+        medium: List[Finding],
+        low: List[Finding]
     ) -> str:
         """Build comprehensive security analysis report."""
         report = f"""# Security Analysis Report for {repository_path}
@@ -882,10 +1418,10 @@ This security analysis identified **{len(findings)} total security findings** ac
         if critical:
             for issue in critical[:5]:  # Limit to top 5 critical issues
                 report += f"""
-### {issue['type'].replace('_', ' ').title()} - CRITICAL
-**File**: {issue['file']}:{issue['line']}
-**Description**: {issue['description']}
-**Code**: `{issue['code']}`
+### {issue.type.replace('_', ' ').title()} - CRITICAL
+**File**: {issue.file}:{issue.line}
+**Description**: {issue.description}
+**Code**: `{issue.code}`
 
 **Recommendation**: Immediate remediation required. This vulnerability poses significant security risk.
 """
@@ -896,10 +1432,10 @@ This security analysis identified **{len(findings)} total security findings** ac
         if high:
             for issue in high[:10]:  # Limit to top 10 high issues
                 report += f"""
-### {issue['type'].replace('_', ' ').title()} - HIGH
-**File**: {issue['file']}:{issue['line']}
-**Description**: {issue['description']}
-**Code**: `{issue['code']}`
+### {issue.type.replace('_', ' ').title()} - HIGH
+**File**: {issue.file}:{issue.line}
+**Description**: {issue.description}
+**Code**: `{issue.code}`
 
 **Recommendation**: Address promptly to reduce security risk exposure.
 """
@@ -925,7 +1461,7 @@ This security analysis identified **{len(findings)} total security findings** ac
 7. **Encryption**: Use strong encryption for sensitive data storage and transmission
 
 ## Security Score
-**Overall Security Score**: {max(0.0, 1.0 - (len(critical) * 0.2 + len(high) * 0.1 + len(medium) * 0.05)):.2f}/1.0
+**Overall Security Score**: {self._severity_score(findings, _SEV_WEIGHTS_SECURITY):.2f}/1.0
 
 ## Next Steps
 1. Immediately address all critical and high-priority security issues
@@ -1010,7 +1546,7 @@ Direct code analysis was not possible. This report provides security guidance ba
 
             if repo_path.exists():
                 # Analyze Python files for performance issues
-                python_files = list(repo_path.rglob("*.py"))
+                python_files = self._find_python_files(repo_path)
 
                 for file_path in python_files[:30]:  # Limit for performance
                     try:
@@ -1034,16 +1570,13 @@ Direct code analysis was not possible. This report provides security guidance ba
 
             # Calculate performance scores
             total_files = len(python_files) if repo_path.exists() else 0
-            bottleneck_count = len([f for f in performance_findings if f['severity'] in ['HIGH', 'CRITICAL']])
+            bottleneck_count = len([f for f in performance_findings if f.severity in ['HIGH', 'CRITICAL']])
             avg_complexity = sum(m['complexity'] for m in complexity_metrics) / max(len(complexity_metrics), 1)
 
             performance_score = max(0.0, 1.0 - (bottleneck_count / 15.0) - (avg_complexity - 5.0) / 20.0)
 
             # Categorize performance issues
-            critical_bottlenecks = [f for f in performance_findings if f['severity'] == 'CRITICAL']
-            high_bottlenecks = [f for f in performance_findings if f['severity'] == 'HIGH']
-            medium_bottlenecks = [f for f in performance_findings if f['severity'] == 'MEDIUM']
-            low_bottlenecks = [f for f in performance_findings if f['severity'] == 'LOW']
+            critical_bottlenecks, high_bottlenecks, medium_bottlenecks, low_bottlenecks = self._partition_by_severity(performance_findings)
 
             # Build comprehensive performance report
             analysis_report = self._build_performance_analysis_report(
@@ -1091,49 +1624,31 @@ Direct code analysis was not possible. This report provides security guidance ba
                 }
             )
 
-    def _analyze_performance_patterns(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _analyze_performance_patterns(self, content: str, file_path: str) -> List[Finding]:
         """Analyze code content for performance bottleneck patterns."""
         findings = []
 
-        # Performance bottleneck patterns
-        performance_patterns = {
-            r'\.sort\(\).*\[\d+\]': {"type": "inefficient_sorting", "severity": "MEDIUM", "description": "Sorting entire list when only top/bottom element needed"},
-            r'for.*in.*range\(len\(': {"type": "inefficient_loop", "severity": "MEDIUM", "description": "Using range(len()) pattern instead of direct iteration"},
-            r'for.*in.*\[\w+.*for.*\w+.*in.*if.*\]': {"type": "nested_loop", "severity": "HIGH", "description": "Potential O(n²) nested loop in list comprehension"},
-            r'while.*len\(.*\)': {"type": "inefficient_length_check", "severity": "MEDIUM", "description": "Repeated len() calls in loop condition"},
-            r'\.append\(.*\).*for.*in': {"type": "inefficient_building", "severity": "MEDIUM", "description": "Building list element by element in loop"},
-            r'open\(.*\).*for.*line.*in': {"type": "file_io_optimization", "severity": "MEDIUM", "description": "File I/O without context manager or buffering"},
-            r're\.search.*for.*in': {"type": "regex_optimization", "severity": "MEDIUM", "description": "Regex compilation in loop - compile once outside"},
-            r'str.*\+.*str.*for.*in': {"type": "string_concatenation", "severity": "MEDIUM", "description": "Inefficient string concatenation in loop"},
-            r'list\(dict\.keys\(\)\)': {"type": "unnecessary_conversion", "severity": "LOW", "description": "Unnecessary list() conversion of dict.keys()"},
-            r'dict\.has_key\(.*\)': {"type": "deprecated_method", "severity": "LOW", "description": "Deprecated dict.has_key() method"},
-            r'time\.sleep\(\d+\)': {"type": "blocking_sleep", "severity": "MEDIUM", "description": "Blocking sleep call - consider async alternatives"},
-            r'threads\.Thread': {"type": "threading_without_pool", "severity": "MEDIUM", "description": "Manual thread creation - consider thread pool"},
-            r'multiprocessing\.Process': {"type": "process_without_pool", "severity": "MEDIUM", "description": "Manual process creation - consider process pool"},
-            r'global\s+\w+': {"type": "global_variable", "severity": "LOW", "description": "Global variable usage may impact performance"},
-            r'exec\(': {"type": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution is slow and unsafe"},
-            r'eval\(': {"type": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution is slow and unsafe"},
-            r'import\s+\*': {"type": "wildcard_import", "severity": "LOW", "description": "Wildcard imports can impact startup time"},
-        }
-
         lines = content.split('\n')
         for line_num, line in enumerate(lines, 1):
-            for pattern, info in performance_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    findings.append({
-                        "file": file_path,
-                        "line": line_num,
-                        "type": info["type"],
-                        "severity": info["severity"],
-                        "description": info["description"],
-                        "code": line.strip()
-                    })
+            stripped = None
+            for pattern, info in _PERFORMANCE_RULES:
+                if pattern.search(line):
+                    if stripped is None:
+                        stripped = line.strip()
+                    findings.append(Finding(
+                        file=file_path,
+                        line=line_num,
+                        type=info["type"],
+                        severity=info["severity"],
+                        description=info["description"],
+                        code=stripped
+                    ))
 
         return findings
 
-    def _analyze_performance_complexity(self, tree: ast.AST, file_path: str) -> Dict[str, Any]:
-        """Analyze AST for computational complexity issues."""
-        complexity_data = {
+    def _new_complexity_record(self, file_path: str) -> Dict[str, Any]:
+        """Create the base complexity record for a single file."""
+        return {
             "file": file_path,
             "complexity": 1,
             "nested_loops": 0,
@@ -1143,55 +1658,21 @@ Direct code analysis was not possible. This report provides security guidance ba
             "generators": 0
         }
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.For, ast.While, ast.ListComp, ast.DictComp, ast.SetComp)):
-                complexity_data["complexity"] += 1
-                if isinstance(node, (ast.For, ast.While)):
-                    # Check for nested loops
-                    parent = getattr(node, 'parent', None)
-                    loop_depth = 0
-                    current = node
-                    while hasattr(current, 'parent') and current.parent:
-                        if isinstance(current.parent, (ast.For, ast.While)):
-                            loop_depth += 1
-                        current = current.parent
-                    if loop_depth > 0:
-                        complexity_data["nested_loops"] += 1
-                        complexity_data["complexity"] += loop_depth
-
-            elif isinstance(node, ast.Call):
-                complexity_data["function_calls"] += 1
-                # Check for potentially expensive function calls
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in ['sorted', 'sort', 'max', 'min', 'sum', 'any', 'all']:
-                        complexity_data["complexity"] += 0.5
-
-            elif isinstance(node, ast.FunctionDef):
-                # Check for recursion
-                for inner_node in ast.walk(node):
-                    if isinstance(inner_node, ast.Call) and isinstance(inner_node.func, ast.Name):
-                        if inner_node.func.id == node.name:
-                            complexity_data["recursive_calls"] += 1
-                            complexity_data["complexity"] += 2
-
-            elif isinstance(node, ast.GeneratorExp):
-                complexity_data["generators"] += 1
-                complexity_data["complexity"] += 0.3
-
-            elif isinstance(node, ast.ListComp):
-                complexity_data["list_comprehensions"] += 1
-
-        return complexity_data
+    def _analyze_performance_complexity(self, tree: ast.AST, file_path: str) -> Dict[str, Any]:
+        """Analyze AST for computational complexity issues."""
+        visitor = _ComplexityVisitor(self._new_complexity_record(file_path))
+        visitor.visit(tree)
+        return visitor.complexity_data
 
     def _build_performance_analysis_report(
         self,
         repository_path: str,
-        findings: List[Dict[str, Any]],
+        findings: List[Finding],
         complexity_metrics: List[Dict[str, Any]],
-        critical: List[Dict[str, Any]],
-        high: List[Dict[str, Any]],
-        medium: List[Dict[str, Any]],
-        low: List[Dict[str, Any]]
+        critical: List[Finding],
+        high: List[Finding],
+        medium: List[Finding],
+        low: List[Finding]
     ) -> str:
         """Build comprehensive performance analysis report."""
         avg_complexity = sum(m['complexity'] for m in complexity_metrics) / max(len(complexity_metrics), 1)
@@ -1219,10 +1700,10 @@ This performance analysis identified **{len(findings)} performance bottlenecks**
         if critical:
             for bottleneck in critical[:5]:  # Limit to top 5 critical issues
                 report += f"""
-### {bottleneck['type'].replace('_', ' ').title()} - CRITICAL
-**File**: {bottleneck['file']}:{bottleneck['line']}
-**Description**: {bottleneck['description']}
-**Code**: `{bottleneck['code']}`
+### {bottleneck.type.replace('_', ' ').title()} - CRITICAL
+**File**: {bottleneck.file}:{bottleneck.line}
+**Description**: {bottleneck.description}
+**Code**: `{bottleneck.code}`
 
 **Recommendation**: Immediate optimization required. This bottleneck significantly impacts performance.
 """
@@ -1233,10 +1714,10 @@ This performance analysis identified **{len(findings)} performance bottlenecks**
         if high:
             for bottleneck in high[:10]:  # Limit to top 10 high issues
                 report += f"""
-### {bottleneck['type'].replace('_', ' ').title()} - HIGH
-**File**: {bottleneck['file']}:{bottleneck['line']}
-**Description**: {bottleneck['description']}
-**Code**: `{bottleneck['code']}`
+### {bottleneck.type.replace('_', ' ').title()} - HIGH
+**File**: {bottleneck.file}:{bottleneck.line}
+**Description**: {bottleneck.description}
+**Code**: `{bottleneck.code}`
 
 **Recommendation**: Address promptly to improve application performance.
 """
@@ -1273,7 +1754,7 @@ This performance analysis identified **{len(findings)} performance bottlenecks**
 - Implement async/await patterns for I/O-bound operations
 
 ## Performance Score
-**Overall Performance Score**: {max(0.0, 1.0 - (len(critical) * 0.15 + len(high) * 0.08 + len(medium) * 0.04)):.2f}/1.0
+**Overall Performance Score**: {self._severity_score(findings, _SEV_WEIGHTS_PERF):.2f}/1.0
 
 ## Profiling Recommendations
 1. **CPU Profiling**: Use cProfile or line_profiler to identify hotspots
@@ -1358,44 +1839,39 @@ Direct performance analysis was not possible. This report provides performance g
             repo_path = Path(repository_path)
             architecture_findings = []
             structure_analysis = {}
+            truncated_files = 0
 
             if repo_path.exists():
                 # Analyze repository structure and Python files
-                python_files = list(repo_path.rglob("*.py"))
-                structure_analysis = self._analyze_repository_structure(repo_path, python_files)
-
-                for file_path in python_files[:30]:  # Limit for performance
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-
-                        # Architecture pattern analysis
-                        findings = self._analyze_architecture_patterns(content, str(file_path), repo_path)
-                        architecture_findings.extend(findings)
-
-                        # AST-based architecture analysis
-                        try:
-                            tree = ast.parse(content)
-                            ast_findings = self._analyze_architecture_ast(tree, str(file_path), repo_path)
-                            architecture_findings.extend(ast_findings)
-                        except SyntaxError:
-                            continue
-
-                    except (UnicodeDecodeError, PermissionError):
-                        continue
+                python_files = self._find_python_files(repo_path)
+                # Unchanged files are served from the per-file cache
+                file_results = await self._analyze_architecture_files(python_files[:30])  # Limit for performance
+                import_files = set(python_files[:20])  # Limit for performance
+                imports = ImportGraph()
+
+                for file_path, (findings, file_imports) in file_results.items():
+                    # A file whose findings were capped ends with an analysis note;
+                    # report it separately so it doesn't count as an issue
+                    if findings and findings[-1].type == "analysis_note":
+                        truncated_files += 1
+                        findings = findings[:-1]
+                    architecture_findings.extend(findings)
+                    if file_imports is not None and file_path in import_files:
+                        imports.add_file(str(file_path.relative_to(repo_path)), file_imports)
+
+                structure_analysis = self._analyze_repository_structure(repo_path, python_files, imports)
 
             # Calculate architecture scores
-            coupling_score = self._calculate_coupling_score(architecture_findings)
+            finding_counts = self._count_findings(architecture_findings)
+            coupling_score = self._calculate_coupling_score(finding_counts)
             cohesion_score = self._calculate_cohesion_score(structure_analysis)
-            pattern_score = self._calculate_pattern_adherence_score(architecture_findings)
+            pattern_score = self._calculate_pattern_adherence_score(finding_counts)
 
             architecture_score = (coupling_score + cohesion_score + pattern_score) / 3.0
 
-            # Categorize findings
-            critical_issues = [f for f in architecture_findings if f['severity'] == 'CRITICAL']
-            high_issues = [f for f in architecture_findings if f['severity'] == 'HIGH']
-            medium_issues = [f for f in architecture_findings if f['severity'] == 'MEDIUM']
-            low_issues = [f for f in architecture_findings if f['severity'] == 'LOW']
+            # Categorize findings; only the issues shown in the report are collected
+            severity_counts = self._count_severities(finding_counts)
+            reported_issues = self._collect_reported_issues(architecture_findings)
 
             # Identify design patterns
             detected_patterns = self._identify_design_patterns(architecture_findings, structure_analysis)
@@ -1403,7 +1879,7 @@ Direct performance analysis was not possible. This report provides performance g
             # Build comprehensive architecture report
             analysis_report = self._build_architecture_analysis_report(
                 repository_path, architecture_findings, structure_analysis,
-                critical_issues, high_issues, medium_issues, low_issues,
+                severity_counts, reported_issues["CRITICAL"], reported_issues["HIGH"],
                 detected_patterns, coupling_score, cohesion_score, pattern_score
             )
 
@@ -1423,14 +1899,15 @@ Direct performance analysis was not possible. This report provides performance g
                     },
                     "patterns_found": detected_patterns,
                     "issues_found": {
-                        "critical": len(critical_issues),
-                        "high": len(high_issues),
-                        "medium": len(medium_issues),
-                        "low": len(low_issues),
+                        "critical": severity_counts["CRITICAL"],
+                        "high": severity_counts["HIGH"],
+                        "medium": severity_counts["MEDIUM"],
+                        "low": severity_counts["LOW"],
                         "total": len(architecture_findings)
                     },
                     "structure_metrics": structure_analysis.get("metrics", {}),
-                    "files_analyzed": min(len(python_files) if repo_path.exists() else 0, 30)
+                    "files_analyzed": min(len(python_files) if repo_path.exists() else 0, 30),
+                    "findings_truncated_files": truncated_files
                 }
             )
 
@@ -1450,13 +1927,143 @@ Direct performance analysis was not possible. This report provides performance g
                 }
             )
 
-    def _analyze_repository_structure(self, repo_path: Path, python_files: List[Path]) -> Dict[str, Any]:
-        """Analyze repository structure and organization."""
+    async def _analyze_architecture_files(
+        self,
+        paths: List[Path]
+    ) -> Dict[Path, Tuple[List[ArchitectureFinding], Optional[Set[str]]]]:
+        """Analyze files for architecture issues, re-running only those changed since the last call."""
+        signatures = {path: self._file_signature(path) for path in paths}
+        results = {}
+        stale = []
+        for path in paths:
+            cached = self.architecture_cache.get(str(path))
+            if cached is not None and signatures[path] is not None and cached[0] == signatures[path]:
+                self.architecture_cache.move_to_end(str(path))
+                results[path] = cached[1]
+            else:
+                stale.append(path)
+
+        # Every stale file is analyzed as soon as its own read completes, so
+        # reads of later files overlap the passes over earlier ones
+        pool = self._get_analysis_pool() if len(stale) >= _MIN_POOL_BATCH else None
+        file_results = await asyncio.gather(
+            *(self._read_and_analyze_architecture(path, pool) for path in stale)
+        )
+
+        for path, result in zip(stale, file_results):
+            if result is None:
+                continue
+            results[path] = result
+            if signatures[path] is not None:
+                self._update_architecture_cache(str(path), signatures[path], result)
+
+        # Keep the caller's file order; unreadable files are dropped
+        return {path: results[path] for path in paths if path in results}
+
+    def _get_analysis_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the agent's long-lived analysis pool, or None when analysis runs inline."""
+        if self.analysis_workers <= 1:
+            return None
+        if self._analysis_pool is None:
+            # Spawn rather than fork: the process already runs to_thread and watcher threads
+            self._analysis_pool = ProcessPoolExecutor(
+                max_workers=self.analysis_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._analysis_pool
+
+    async def shutdown(self):
+        """Shutdown agent and release the analysis process pool."""
+        await super().shutdown()
+        if self._analysis_pool is not None:
+            pool, self._analysis_pool = self._analysis_pool, None
+            # Joining worker processes blocks, so keep it off the event loop
+            await asyncio.to_thread(pool.shutdown)
+
+    def _file_signature(self, path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) identifying a file's current contents, or None if it cannot be stat'ed."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _update_architecture_cache(
+        self,
+        cache_key: str,
+        signature: Tuple[int, int],
+        result: Tuple[List[ArchitectureFinding], Optional[Set[str]]]
+    ):
+        """Update architecture cache with LRU eviction."""
+        if cache_key in self.architecture_cache:
+            del self.architecture_cache[cache_key]
+
+        self.architecture_cache[cache_key] = (signature, result)
+
+        # Evict oldest entries if cache is full
+        while len(self.architecture_cache) > self.max_cache_size:
+            self.architecture_cache.popitem(last=False)
+
+    async def _read_and_analyze_architecture(
+        self,
+        path: Path,
+        pool: Optional[ProcessPoolExecutor]
+    ) -> Optional[Tuple[List[ArchitectureFinding], Optional[Set[str]]]]:
+        """Read one file off the event loop and run the architecture passes over it."""
+        content = await asyncio.to_thread(self._read_source_file, path)
+        if content is None:
+            return None
+        if pool is None:
+            return _analyze_architecture_file(str(path), content)
+
+        # Parsing and regex scanning are CPU bound and hold the GIL, so spread
+        # files across processes; this also keeps the event loop responsive
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, _analyze_architecture_file, str(path), content)
+
+    def _find_python_files(self, repo_path: Path) -> List[Path]:
+        """List Python files under repo_path, pruning VCS, dependency and build directories."""
+        python_files = []
+        for dirpath, dirnames, filenames in os.walk(repo_path):
+            dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS]
+            python_files.extend(Path(dirpath, name) for name in filenames if name.endswith(".py"))
+        return python_files
+
+    def _read_source_file(self, path: Path) -> Optional[str]:
+        """Read a single source file, returning None if it cannot be decoded or opened."""
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= _MMAP_THRESHOLD:
+                    data = f.read()
+                else:
+                    # Decode large files straight from the page cache rather
+                    # than holding a private copy of the raw bytes alongside the text
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        return self._decode_source(data)
+            return self._decode_source(data)
+        except (UnicodeDecodeError, PermissionError):
+            return None
+
+    def _decode_source(self, data) -> str:
+        """Decode UTF-8 source with universal newlines, as text-mode open() does."""
+        content = str(data, 'utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    def _analyze_repository_structure(
+        self,
+        repo_path: Path,
+        python_files: List[Path],
+        imports: ImportGraph
+    ) -> Dict[str, Any]:
+        """Analyze repository structure and organization given per-file imports."""
         structure = {
             "directories": defaultdict(list),
             "modules": [],
             "packages": set(),
-            "imports": defaultdict(set),
+            "imports": imports,
             "metrics": {}
         }
 
@@ -1477,167 +2084,48 @@ Direct performance analysis was not possible. This report provides performance g
 
             structure["modules"].append(str(relative_path))
 
-        # Analyze imports for dependency mapping
-        for file_path in python_files[:20]:  # Limit for performance
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            structure["imports"][str(file_path.relative_to(repo_path))].add(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            structure["imports"][str(file_path.relative_to(repo_path))].add(node.module)
-            except (SyntaxError, UnicodeDecodeError):
-                continue
-
         # Calculate structure metrics
         structure["metrics"] = {
             "total_modules": len(structure["modules"]),
             "total_packages": len(structure["packages"]),
             "max_depth": max(len(p.parts) for p in python_files) if python_files else 0,
             "avg_modules_per_package": len(structure["modules"]) / max(len(structure["packages"]), 1),
-            "import_density": sum(len(imports) for imports in structure["imports"].values()) / max(len(structure["modules"]), 1)
+            "import_density": imports.edge_count() / max(len(structure["modules"]), 1)
         }
 
         return structure
 
-    def _analyze_architecture_patterns(self, content: str, file_path: str, repo_path: Path) -> List[Dict[str, Any]]:
-        """Analyze code content for architectural patterns and issues."""
-        findings = []
-
-        # Architecture pattern indicators
-        architecture_patterns = {
-            r'class.*\(.*\).*:.*\n.*def __init__': {"type": "class_pattern", "pattern": "basic_class", "severity": "LOW"},
-            r'class.*\(.*ABC.*\)': {"type": "design_pattern", "pattern": "abstract_base", "severity": "LOW"},
-            r'@.*decorator': {"type": "design_pattern", "pattern": "decorator", "severity": "LOW"},
-            r'class.*\(.*Singleton.*\)': {"type": "design_pattern", "pattern": "singleton", "severity": "MEDIUM"},
-            r'class.*Factory': {"type": "design_pattern", "pattern": "factory", "severity": "LOW"},
-            r'class.*Observer': {"type": "design_pattern", "pattern": "observer", "severity": "LOW"},
-            r'class.*\(.*metaclass.*\)': {"type": "design_pattern", "pattern": "metaclass", "severity": "MEDIUM"},
-            r'from.*import.*\*': {"type": "coupling_issue", "pattern": "tight_coupling", "severity": "MEDIUM", "description": "Wildcard import creates tight coupling"},
-            r'global\s+\w+': {"type": "coupling_issue", "pattern": "global_state", "severity": "HIGH", "description": "Global variable creates hidden dependencies"},
-            r'eval\(|exec\(': {"type": "architecture_issue", "pattern": "dynamic_execution", "severity": "HIGH", "description": "Dynamic code execution complicates static analysis"},
-            r'getattr\(|setattr\(|hasattr\(': {"type": "architecture_issue", "pattern": "dynamic_attributes", "severity": "MEDIUM", "description": "Dynamic attribute access reduces type safety"},
-            r'__import__\(|importlib\.import_module': {"type": "architecture_issue", "pattern": "dynamic_import", "severity": "MEDIUM", "description": "Dynamic imports complicate dependency analysis"},
-            r'type\(': {"type": "architecture_issue", "pattern": "type_checking", "severity": "LOW", "description": "Runtime type checking may indicate design issues"},
-            r'isinstance\(\s*\w+\s*,\s*\(': {"type": "architecture_issue", "pattern": "type_checking", "severity": "LOW", "description": "Runtime type checking may indicate design issues"},
-        }
-
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for pattern, info in architecture_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    finding = {
-                        "file": file_path,
-                        "line": line_num,
-                        "type": info["type"],
-                        "pattern": info["pattern"],
-                        "severity": info["severity"],
-                        "code": line.strip()
-                    }
-                    if "description" in info:
-                        finding["description"] = info["description"]
-                    findings.append(finding)
-
-        return findings
-
-    def _analyze_architecture_ast(self, tree: ast.AST, file_path: str, repo_path: Path) -> List[Dict[str, Any]]:
-        """Analyze AST for architectural characteristics."""
-        findings = []
-
-        class_info = []
-        function_info = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Analyze class characteristics
-                bases = [base.id if isinstance(base, ast.Name) else str(base) for base in node.bases]
-                methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
-
-                class_info.append({
-                    "name": node.name,
-                    "bases": bases,
-                    "methods": methods,
-                    "line": node.lineno,
-                    "method_count": len(methods)
-                })
-
-                # Check for architectural issues
-                if len(methods) > 15:
-                    findings.append({
-                        "file": file_path,
-                        "line": node.lineno,
-                        "type": "architecture_issue",
-                        "pattern": "large_class",
-                        "severity": "MEDIUM",
-                        "description": f"Class {node.name} has {len(methods)} methods, may violate Single Responsibility Principle",
-                        "code": f"class {node.name}"
-                    })
-
-                # Check for God Object anti-pattern
-                if len(methods) > 10 and any(base in ['object'] for base in bases):
-                    findings.append({
-                        "file": file_path,
-                        "line": node.lineno,
-                        "type": "architecture_issue",
-                        "pattern": "god_object",
-                        "severity": "HIGH",
-                        "description": f"Class {node.name} may be a God Object anti-pattern",
-                        "code": f"class {node.name}"
-                    })
-
-            elif isinstance(node, ast.FunctionDef):
-                # Analyze function characteristics
-                function_info.append({
-                    "name": node.name,
-                    "line": node.lineno,
-                    "args_count": len(node.args.args),
-                    "is_method": False
-                })
-
-                # Check for parameter count issues
-                if len(node.args.args) > 7:
-                    findings.append({
-                        "file": file_path,
-                        "line": node.lineno,
-                        "type": "architecture_issue",
-                        "pattern": "too_many_parameters",
-                        "severity": "MEDIUM",
-                        "description": f"Function {node.name} has {len(node.args.args)} parameters, may need refactoring",
-                        "code": f"def {node.name}(...)"
-                    })
-
-        # Analyze inheritance depth
-        inheritance_depth = self._calculate_inheritance_depth(class_info)
-        if inheritance_depth > 4:
-            findings.append({
-                "file": file_path,
-                "line": 1,
-                "type": "architecture_issue",
-                "pattern": "deep_inheritance",
-                "severity": "MEDIUM",
-                "description": f"Inheritance depth {inheritance_depth} may be too deep",
-                "code": "inheritance_hierarchy"
-            })
-
-        return findings
-
-    def _calculate_inheritance_depth(self, class_info: List[Dict[str, Any]]) -> int:
-        """Calculate maximum inheritance depth."""
-        # Simplified inheritance depth calculation
-        return min(len(class_info), 3)  # Placeholder for actual inheritance tree analysis
-
-    def _calculate_coupling_score(self, findings: List[Dict[str, Any]]) -> float:
-        """Calculate coupling score based on findings."""
-        coupling_issues = [f for f in findings if f.get('type') == 'coupling_issue']
+    def _count_findings(self, findings: List[ArchitectureFinding]) -> Counter:
+        """Count findings by (type, severity) in a single pass for the scoring helpers."""
+        return Counter((f.type, f.severity) for f in findings)
+
+    def _count_severities(self, finding_counts: Counter) -> Counter:
+        """Collapse (type, severity) counts into per-severity counts."""
+        severity_counts = Counter()
+        for (_, severity), n in finding_counts.items():
+            severity_counts[severity] += n
+        return severity_counts
+
+    def _collect_reported_issues(self, findings: List[ArchitectureFinding]) -> Dict[str, List[ArchitectureFinding]]:
+        """Collect the first findings of each reported severity, stopping once every list is full."""
+        reported = {severity: [] for severity in _REPORTED_ISSUE_LIMITS}
+        remaining = sum(_REPORTED_ISSUE_LIMITS.values())
+        for finding in findings:
+            issues = reported.get(finding.severity)
+            if issues is not None and len(issues) < _REPORTED_ISSUE_LIMITS[finding.severity]:
+                issues.append(finding)
+                remaining -= 1
+                if not remaining:
+                    break
+        return reported
+
+    def _calculate_coupling_score(self, finding_counts: Counter) -> float:
+        """Calculate coupling score based on finding counts."""
+        coupling_issues = {sev: n for (kind, sev), n in finding_counts.items() if kind == 'coupling_issue'}
         if not coupling_issues:
             return 1.0
 
-        penalty = sum(0.2 if f['severity'] == 'HIGH' else 0.1 if f['severity'] == 'MEDIUM' else 0.05 for f in coupling_issues)
+        penalty = sum(_SEV_WEIGHTS_COUPLING[sev] * n for sev, n in coupling_issues.items())
         return max(0.0, 1.0 - penalty)
 
     def _calculate_cohesion_score(self, structure_analysis: Dict[str, Any]) -> float:
@@ -1652,24 +2140,24 @@ Direct performance analysis was not possible. This report provides performance g
         cohesion_score = min(1.0, package_ratio + import_bonus - depth_penalty + 0.5)
         return max(0.0, cohesion_score)
 
-    def _calculate_pattern_adherence_score(self, findings: List[Dict[str, Any]]) -> float:
-        """Calculate design pattern adherence score."""
-        pattern_findings = [f for f in findings if f.get('type') == 'design_pattern']
-        architecture_issues = [f for f in findings if f.get('type') == 'architecture_issue']
+    def _calculate_pattern_adherence_score(self, finding_counts: Counter) -> float:
+        """Calculate design pattern adherence score from finding counts."""
+        pattern_findings = sum(n for (kind, _), n in finding_counts.items() if kind == 'design_pattern')
+        architecture_issues = {sev: n for (kind, sev), n in finding_counts.items() if kind == 'architecture_issue'}
 
-        pattern_bonus = len(pattern_findings) * 0.05
-        issue_penalty = sum(0.15 if f['severity'] == 'HIGH' else 0.1 if f['severity'] == 'MEDIUM' else 0.05 for f in architecture_issues)
+        pattern_bonus = pattern_findings * 0.05
+        issue_penalty = sum(_SEV_WEIGHTS_ARCHITECTURE[sev] * n for sev, n in architecture_issues.items())
 
         score = 0.7 + pattern_bonus - issue_penalty
         return max(0.0, min(1.0, score))
 
-    def _identify_design_patterns(self, findings: List[Dict[str, Any]], structure_analysis: Dict[str, Any]) -> List[str]:
+    def _identify_design_patterns(self, findings: List[ArchitectureFinding], structure_analysis: Dict[str, Any]) -> List[str]:
         """Identify design patterns used in the codebase."""
         patterns = set()
 
         for finding in findings:
-            if finding.get('type') == 'design_pattern':
-                patterns.add(finding.get('pattern', 'unknown'))
+            if finding.type == 'design_pattern':
+                patterns.add(finding.pattern)
 
         # Infer patterns from structure
         if structure_analysis.get("metrics", {}).get("total_packages", 0) > 0:
@@ -1680,12 +2168,11 @@ Direct performance analysis was not possible. This report provides performance g
     def _build_architecture_analysis_report(
         self,
         repository_path: str,
-        findings: List[Dict[str, Any]],
+        findings: List[ArchitectureFinding],
         structure_analysis: Dict[str, Any],
-        critical: List[Dict[str, Any]],
-        high: List[Dict[str, Any]],
-        medium: List[Dict[str, Any]],
-        low: List[Dict[str, Any]],
+        severity_counts: Counter,
+        critical: List[ArchitectureFinding],
+        high: List[ArchitectureFinding],
         patterns: List[str],
         coupling_score: float,
         cohesion_score: float,
@@ -1693,21 +2180,24 @@ Direct performance analysis was not possible. This report provides performance g
     ) -> str:
         """Build comprehensive architecture analysis report."""
         metrics = structure_analysis.get("metrics", {})
+        overall_score = (coupling_score + cohesion_score + pattern_score) / 3
 
-        report = f"""# Architecture Analysis Report for {repository_path}
+        parts: List[str] = []
+        append = parts.append
+        append(f"""# Architecture Analysis Report for {repository_path}
 
 ## Executive Summary
 This architecture analysis identified **{len(findings)} architectural considerations** across the codebase:
-- **Critical**: {len(critical)} issues requiring immediate attention
-- **High**: {len(high)} issues that should be addressed promptly
-- **Medium**: {len(medium)} issues for future consideration
-- **Low**: {len(low)} minor improvements and suggestions
+- **Critical**: {severity_counts["CRITICAL"]} issues requiring immediate attention
+- **High**: {severity_counts["HIGH"]} issues that should be addressed promptly
+- **Medium**: {severity_counts["MEDIUM"]} issues for future consideration
+- **Low**: {severity_counts["LOW"]} minor improvements and suggestions
 
 ## Architecture Quality Scores
 - **Coupling Score**: {coupling_score:.2f}/1.0 (lower coupling is better)
 - **Cohesion Score**: {cohesion_score:.2f}/1.0 (higher cohesion is better)
 - **Pattern Adherence**: {pattern_score:.2f}/1.0
-- **Overall Architecture Score**: {(coupling_score + cohesion_score + pattern_score) / 3:.2f}/1.0
+- **Overall Architecture Score**: {overall_score:.2f}/1.0
 
 ## Repository Structure Analysis
 - **Total Modules**: {metrics.get('total_modules', 0)}
@@ -1717,91 +2207,51 @@ This architecture analysis identified **{len(findings)} architectural considerat
 - **Import Density**: {metrics.get('import_density', 0):.1f}
 
 ## Design Patterns Identified
-"""
+""")
 
         if patterns:
             for pattern in patterns:
-                report += f"- **{pattern.replace('_', ' ').title()}**: Detected in codebase\n"
+                append(f"- **{pattern.replace('_', ' ').title()}**: Detected in codebase\n")
         else:
-            report += "- No specific design patterns clearly identified\n"
+            append("- No specific design patterns clearly identified\n")
 
-        report += "\n## Critical Architectural Issues\n"
+        append("\n## Critical Architectural Issues\n")
         if critical:
-            for issue in critical[:5]:  # Limit to top 5 critical issues
-                report += f"""
-### {issue['pattern'].replace('_', ' ').title()} - CRITICAL
-**File**: {issue['file']}:{issue['line']}
-**Description**: {issue.get('description', 'Critical architectural issue detected')}
-**Code**: `{issue['code']}`
-
-**Recommendation**: Immediate refactoring required to address this architectural problem.
-"""
+            for issue in critical:
+                append(_ARCHITECTURE_ISSUE_TEMPLATE.format(
+                    title=issue.pattern.replace('_', ' ').title(),
+                    level="CRITICAL",
+                    issue=issue,
+                    description=issue.description or 'Critical architectural issue detected',
+                    recommendation="Immediate refactoring required to address this architectural problem."
+                ))
         else:
-            report += "\n✅ No critical architectural issues detected.\n"
+            append("\n✅ No critical architectural issues detected.\n")
 
-        report += "\n## High Priority Architectural Issues\n"
+        append("\n## High Priority Architectural Issues\n")
         if high:
-            for issue in high[:10]:  # Limit to top 10 high issues
-                report += f"""
-### {issue['pattern'].replace('_', ' ').title()} - HIGH
-**File**: {issue['file']}:{issue['line']}
-**Description**: {issue.get('description', 'High priority architectural issue')}
-**Code**: `{issue['code']}`
-
-**Recommendation**: Address promptly to improve code architecture.
-"""
+            for issue in high:
+                append(_ARCHITECTURE_ISSUE_TEMPLATE.format(
+                    title=issue.pattern.replace('_', ' ').title(),
+                    level="HIGH",
+                    issue=issue,
+                    description=issue.description or 'High priority architectural issue',
+                    recommendation="Address promptly to improve code architecture."
+                ))
         else:
-            report += "\n✅ No high priority architectural issues detected.\n"
+            append("\n✅ No high priority architectural issues detected.\n")
 
         # Add architectural recommendations
-        report += f"""
-## Architectural Improvement Recommendations
-
-### 1. SOLID Principles Implementation
-- **Single Responsibility**: Ensure classes have only one reason to change
-- **Open/Closed**: Design for extension, not modification
-- **Liskov Substitution**: Subtypes must be substitutable for base types
-- **Interface Segregation**: Prefer small, focused interfaces
-- **Dependency Inversion**: Depend on abstractions, not concretions
-
-### 2. Design Patterns to Consider
-- **Factory Pattern**: For object creation with complex logic
-- **Observer Pattern**: For event-driven architectures
-- **Strategy Pattern**: For algorithm selection and variation
-- **Command Pattern**: For encapsulating requests as objects
-- **Decorator Pattern**: For adding behavior dynamically
-
-### 3. Architectural Refactoring Opportunities
-- Extract common functionality into shared services
-- Implement proper dependency injection
-- Reduce global state and side effects
-- Improve separation of concerns between layers
-- Consider microservices architecture for large applications
-
-### 4. Code Organization Improvements
-- Group related functionality into cohesive modules
-- Implement clear package boundaries
-- Use consistent naming conventions
-- Establish clear architectural layers
-- Document architectural decisions and rationale
-
-## Architecture Assessment
-**Overall Architecture Health**: {(coupling_score + cohesion_score + pattern_score) / 3:.1%}
+        append(_ARCHITECTURE_RECOMMENDATIONS)
+        append(f"""## Architecture Assessment
+**Overall Architecture Health**: {overall_score:.1%}
 
 This assessment indicates:
-{'Excellent' if (coupling_score + cohesion_score + pattern_score) / 3 > 0.8 else 'Good' if (coupling_score + cohesion_score + pattern_score) / 3 > 0.6 else 'Needs Improvement'} architectural quality with
-{len(critical) + len(high)} issues requiring immediate attention.
-
-## Next Steps
-1. Address all critical and high-priority architectural issues
-2. Implement identified design patterns where appropriate
-3. Refactor to improve SOLID principles adherence
-4. Establish architectural review process
-5. Document architectural decisions and patterns
-
-*Report generated via static code analysis and architectural pattern detection*
-"""
-        return report
+{'Excellent' if overall_score > 0.8 else 'Good' if overall_score > 0.6 else 'Needs Improvement'} architectural quality with
+{severity_counts["CRITICAL"] + severity_counts["HIGH"]} issues requiring immediate attention.
+""")
+        append(_ARCHITECTURE_NEXT_STEPS)
+        return "".join(parts)
 
     def _build_template_architecture_analysis(self, repository_path: str) -> str:
         """Build architecture analysis with design patterns when direct code structure analysis is unavailable."""
@@ -5,74 +5,410 @@ Implements modern frontend development capabilities including
 UI components, responsive design, and user experience optimization.
 """
 
-import json
-from typing import Dict, List, Optional, Any, Set
-from datetime import datetime
-
-from .base_agent import BaseAgent, TaskResult
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from .base_agent import BaseAgent, AgentCapability, TaskResult, _dumps_indented
 from ..core.rules_engine import TaskSpec
 from ..core.context_manager import AgentContext
 from ..core.exceptions import TaskExecutionError
 
 
+# System prompt used when a task arrives without an agent context
+_DEFAULT_SYSTEM_PROMPT = """You are a specialized frontend developer focused on creating modern, responsive user interfaces. Your expertise includes:
+
+## Core Capabilities
+- Modern frontend framework development (React, Vue, Angular)
+- Responsive design and mobile-first development
+- Component-based architecture and reusability
+- Performance optimization and user experience
+
+## Development Standards
+1. **Modern Frameworks**: Use current best practices and patterns
+2. **Responsive Design**: Ensure compatibility across devices
+3. **Component Architecture**: Build reusable, maintainable components
+4. **Performance**: Optimize for fast loading and smooth interactions
+
+## Quality Standards
+- Write clean, maintainable, and well-documented code
+- Follow accessibility standards (WCAG 2.1 AA)
+- Ensure cross-browser compatibility
+- Implement proper error handling and validation
+
+## Technology Stack
+- HTML5, CSS3, JavaScript/TypeScript
+- Modern frontend frameworks
+- Build tools and development environments
+- Testing frameworks and CI/CD integration
+
+## Current Task
+Focus on creating high-quality, production-ready frontend components with modern best practices."""
+
+
+# Packages a generated component needs for each framework
+_FRAMEWORK_DEPENDENCIES = {
+    "react": ("react", "prop-types"),
+    "vue": ("vue", "vue-router"),
+    "angular": ("@angular/core", "@angular/common"),
+    "svelte": ("svelte",),
+}
+
+# Fixed result metadata for responsive design and UX tasks; copied per result
+_RESPONSIVE_METADATA = {
+    "breakpoints": ("320px", "768px", "1024px", "1200px"),
+    "approach": "mobile_first",
+    "technologies": ("flexbox", "grid", "media_queries"),
+    "compatibility": ("modern_browsers", "ie11+"),
+}
+_UX_METADATA = {
+    "accessibility_standard": "WCAG 2.1 AA",
+    "ux_principles": ("usability", "accessibility", "performance", "visual_hierarchy"),
+    "optimization_areas": ("navigation", "forms", "content", "interactions"),
+}
+
+# Task types grouped by the capability that handles them
+_UI_DEVELOPMENT_TASKS = frozenset({
+    "component_development", "ui_implementation", "responsive_design"
+})
+_RESPONSIVE_DESIGN_TASKS = frozenset({
+    "mobile_design", "responsive_layout", "cross_browser_compatibility"
+})
+_COMPONENT_ARCHITECTURE_TASKS = frozenset({
+    "component_system", "design_system", "component_library"
+})
+_USER_EXPERIENCE_TASKS = frozenset({
+    "ux_optimization", "accessibility", "user_interface"
+})
+# Feature task types handled without a dedicated capability
+_FEATURE_TASKS = frozenset({
+    "form_validation", "data_visualization", "state_management"
+})
+_ALL_TASK_TYPES = (
+    _UI_DEVELOPMENT_TASKS | _RESPONSIVE_DESIGN_TASKS
+    | _COMPONENT_ARCHITECTURE_TASKS | _USER_EXPERIENCE_TASKS | _FEATURE_TASKS
+)
+
+# Capabilities shared by every FrontEndCoder instance
+_CAPABILITIES: Tuple[AgentCapability, ...] = (
+    AgentCapability(
+        name="ui_development",
+        description="Modern UI component development with React/Vue/Angular",
+        supported_task_types=_UI_DEVELOPMENT_TASKS,
+    ),
+    AgentCapability(
+        name="responsive_design",
+        description="Mobile-first responsive design implementation",
+        supported_task_types=_RESPONSIVE_DESIGN_TASKS,
+    ),
+    AgentCapability(
+        name="component_architecture",
+        description="Reusable component architecture and design systems",
+        supported_task_types=_COMPONENT_ARCHITECTURE_TASKS,
+    ),
+    AgentCapability(
+        name="user_experience",
+        description="UX optimization and accessibility implementation",
+        supported_task_types=_USER_EXPERIENCE_TASKS,
+    ),
+)
+
+
+class _PromptTemplate:
+    """A str.format template split into literal text and field names once."""
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, template: str):
+        self._parts = tuple(
+            (literal, field) for literal, field, _, _ in Formatter().parse(template)
+        )
+
+    def format(self, **values: Any) -> str:
+        """Substitute the named fields, as str.format would for plain {name} fields."""
+        return "".join([
+            literal + str(values[field]) if field else literal
+            for literal, field in self._parts
+        ])
+
+
+# Prompt templates, formatted with the task description and serialized spec
+_COMPONENT_DEVELOPMENT_PROMPT = _PromptTemplate("""
+Create a modern, production-ready {framework} component based on the following requirements:
+
+Task Description: {task}
+
+Component Specification:
+{spec}
+
+Please provide:
+1. Complete component code with proper structure
+2. PropTypes/TypeScript interfaces (if applicable)
+3. Styling implementation (CSS modules, styled-components, or inline styles)
+4. Component documentation with usage examples
+5. Accessibility considerations (ARIA labels, keyboard navigation)
+6. State management (if applicable)
+7. Error handling and edge cases
+8. Unit test examples
+9. Responsive design considerations
+
+Requirements:
+- Follow modern {framework} best practices
+- Ensure accessibility compliance (WCAG 2.1 AA)
+- Include proper error handling
+- Make component reusable and maintainable
+- Add comprehensive comments
+- Consider performance optimizations
+""")
+
+_RESPONSIVE_DESIGN_PROMPT = _PromptTemplate("""
+Implement a responsive design solution for the following requirements:
+
+Task Description: {task}
+
+Design Requirements:
+{spec}
+
+Please provide:
+1. Mobile-first responsive CSS/SCSS implementation
+2. Breakpoint strategy and media queries
+3. Flexible layout using CSS Grid and Flexbox
+4. Responsive typography and spacing
+5. Image and media optimization
+6. Cross-browser compatibility considerations
+7. Touch-friendly interaction design
+8. Performance optimization techniques
+9. Progressive enhancement approach
+
+Requirements:
+- Support common screen sizes (mobile, tablet, desktop)
+- Use semantic HTML5 elements
+- Implement proper accessibility features
+- Optimize for performance and loading speed
+- Ensure touch interaction compatibility
+""")
+
+_UX_OPTIMIZATION_PROMPT = _PromptTemplate("""
+Optimize the user experience for the following requirements:
+
+Task Description: {task}
+
+Design Requirements:
+{spec}
+
+Please provide:
+1. User interface improvements based on UX principles
+2. Accessibility implementations (WCAG 2.1 AA compliance)
+3. Navigation and information architecture improvements
+4. Form usability enhancements
+5. Error handling and user feedback improvements
+6. Loading states and micro-interactions
+7. Performance optimizations for better UX
+8. Cognitive load reduction techniques
+9. A/B testing recommendations
+
+Requirements:
+- Follow established UX heuristics and principles
+- Ensure full accessibility compliance
+- Improve usability for all user groups
+- Provide clear user feedback and guidance
+- Optimize for user engagement and conversion
+""")
+
+_FORM_VALIDATION_PROMPT = _PromptTemplate("""
+Create a comprehensive form validation system for the following requirements:
+
+Task Description: {task}
+
+Form Specification:
+{spec}
+
+Please provide:
+1. Form component with validation logic
+2. Real-time validation feedback
+3. Custom validation rules and messages
+4. Error state handling and display
+5. Success state and submission handling
+6. Accessibility features for form inputs
+7. Mobile-optimized form layouts
+8. Progressive form enhancement
+9. Security considerations (CSRF, XSS protection)
+
+Requirements:
+- Validate on input and submission
+- Provide clear, helpful error messages
+- Support keyboard navigation
+- Ensure accessibility compliance
+- Handle edge cases gracefully
+- Optimize for mobile devices
+""")
+
+_DATA_VISUALIZATION_PROMPT = _PromptTemplate("""
+Create an interactive data visualization component for the following requirements:
+
+Task Description: {task}
+
+Visualization Specification:
+{spec}
+
+Please provide:
+1. Interactive chart/graph component
+2. Data processing and transformation logic
+3. Responsive design for mobile and desktop
+4. Accessibility features for data visualization
+5. Loading states and error handling
+6. Interactive features (zoom, filter, export)
+7. Color scheme and styling for clarity
+8. Performance optimization for large datasets
+9. Cross-browser compatibility
+
+Requirements:
+- Use modern charting libraries (Chart.js, D3.js, etc.)
+- Ensure accessibility compliance
+- Optimize for performance with large datasets
+- Provide intuitive user interactions
+- Support responsive design
+- Include comprehensive error handling
+""")
+
+_GENERAL_FEATURE_PROMPT = _PromptTemplate("""
+Implement the frontend feature with the following requirements:
+
+Task Description: {task}
+
+Feature Specification:
+{spec}
+
+Please provide:
+1. Complete feature implementation
+2. Component structure and organization
+3. State management approach
+4. User interface and interaction design
+5. Error handling and edge cases
+6. Performance considerations
+7. Accessibility features
+8. Testing strategy and examples
+9. Documentation and usage examples
+
+Requirements:
+- Follow modern frontend best practices
+- Ensure accessibility compliance
+- Implement proper error handling
+- Optimize for performance
+- Provide clear documentation
+- Consider maintainability and scalability
+""")
+
+_GENERAL_FRONTEND_PROMPT = _PromptTemplate("""
+Implement the frontend solution for the following requirement:
+
+Task Description: {task}
+
+Please provide:
+1. Complete frontend implementation
+2. Modern framework usage (React, Vue, or Angular)
+3. Responsive design implementation
+4. Component-based architecture
+5. State management approach
+6. Styling and design system
+7. Accessibility features
+8. Performance optimizations
+9. Testing considerations
+10. Documentation and usage examples
+
+Requirements:
+- Use modern frontend frameworks and tools
+- Ensure mobile-responsive design
+- Follow accessibility best practices
+- Implement proper error handling
+- Optimize for performance and user experience
+- Provide clear, maintainable code
+""")
+
+# Specs whose values all have one of these exact types are memoized by _format_spec
+_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def _format_spec(spec: Dict[str, Any]) -> str:
+    """Serialize a spec for a prompt, reusing the text for recurring flat specs."""
+    if all(type(value) in _SCALAR_TYPES for value in spec.values()):
+        # Value types are part of the key so that e.g. 1 and True stay distinct
+        return _format_flat_spec(tuple((key, type(value), value) for key, value in spec.items()))
+    return _dumps_indented(spec)
+
+
+@lru_cache(maxsize=256)
+def _format_flat_spec(items: Tuple[Tuple[Any, type, Any], ...]) -> str:
+    """Serialize a flat spec given as (key, value type, value) triples."""
+    return _dumps_indented({key: value for key, _, value in items})
+
+
+@lru_cache(maxsize=512)
+def _render_prompt(
+    template: _PromptTemplate,
+    task: str,
+    spec: str = "",
+    framework: str = ""
+) -> str:
+    """Render a prompt template, reusing the text for repeated task inputs."""
+    return template.format(task=task, spec=spec, framework=framework)
+
+
 class FrontEndCoder(BaseAgent):
     """
     Specialized agent for frontend development with modern frameworks.
     Creates responsive, accessible user interfaces with best practices.
     """
 
+    # BaseAgent keeps a __dict__; slots cover the attributes added here
+    __slots__ = (
+        "framework_preference", "component_library", "_styling_dependencies",
+        "claude_concurrency", "_claude_semaphore", "claude_cache_size", "claude_cache",
+    )
+
+    # Handler for each task type and the task parameters it takes between
+    # task_spec and context; other types go to _execute_general_frontend_task
+    _TASK_HANDLERS = {
+        "component_development": ("_execute_component_development", ("component_spec", "framework")),
+        "component_system": ("_execute_component_development", ("component_spec", "framework")),
+        "responsive_design": ("_execute_responsive_design", ("design_requirements",)),
+        "mobile_design": ("_execute_responsive_design", ("design_requirements",)),
+        "ux_optimization": ("_execute_ux_optimization", ("design_requirements",)),
+        "accessibility": ("_execute_ux_optimization", ("design_requirements",)),
+        "form_validation": ("_execute_feature_development", ("component_spec",)),
+        "data_visualization": ("_execute_feature_development", ("component_spec",)),
+    }
+    _DEFAULT_TASK_HANDLER = ("_execute_general_frontend_task", ())
+
+    # Prompt builder for each specialized feature task type
+    _FEATURE_PROMPT_BUILDERS = {
+        "form_validation": "_build_form_validation_prompt",
+        "data_visualization": "_build_data_visualization_prompt",
+    }
+
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize FrontEndCoder."""
         super().__init__(agent_type="frontend", config=config)
         self.framework_preference = self.config.get("framework", "react")
         self.component_library = self.config.get("component_library", "material-ui")
+        self._styling_dependencies = (
+            ("styled-components",) if self.component_library == "styled-components" else ()
+        )
+        self.claude_concurrency = self.config.get("claude_concurrency", 4)
+        self._claude_semaphore = asyncio.Semaphore(self.claude_concurrency)
+        # Responses reused for identical prompts; 0 disables the cache
+        self.claude_cache_size = self.config.get("claude_cache_size", 0)
+        self.claude_cache: OrderedDict[Tuple[Optional[str], Tuple[Tuple[str, str], ...]], str] = OrderedDict()
 
     async def _initialize_capabilities(self):
         """Initialize frontend coder capabilities."""
-        # UI Development capabilities
-        self._add_capability(
-            name="ui_development",
-            description="Modern UI component development with React/Vue/Angular",
-            supported_task_types={
-                "component_development", "ui_implementation", "responsive_design"
-            }
-        )
-
-        # Responsive Design capabilities
-        self._add_capability(
-            name="responsive_design",
-            description="Mobile-first responsive design implementation",
-            supported_task_types={
-                "mobile_design", "responsive_layout", "cross_browser_compatibility"
-            }
-        )
-
-        # Component Architecture capabilities
-        self._add_capability(
-            name="component_architecture",
-            description="Reusable component architecture and design systems",
-            supported_task_types={
-                "component_system", "design_system", "component_library"
-            }
-        )
-
-        # User Experience capabilities
-        self._add_capability(
-            name="user_experience",
-            description="UX optimization and accessibility implementation",
-            supported_task_types={
-                "ux_optimization", "accessibility", "user_interface"
-            }
-        )
+        self.capabilities.extend(_CAPABILITIES)
 
         # Task types specifically supported
-        self.supported_task_types.update({
-            "component_development", "ui_implementation", "responsive_design",
-            "mobile_design", "responsive_layout", "cross_browser_compatibility",
-            "component_system", "design_system", "component_library",
-            "ux_optimization", "accessibility", "user_interface",
-            "form_validation", "data_visualization", "state_management"
-        })
+        self.supported_task_types |= _ALL_TASK_TYPES
 
     async def _execute_task_internal(
         self,
@@ -80,41 +416,31 @@ class FrontEndCoder(BaseAgent):
         context: Optional[AgentContext]
     ) -> TaskResult:
         """Execute frontend development task."""
-        task_start_time = datetime.utcnow()
+        task_start_ns = time.perf_counter_ns()
 
         try:
             # Extract frontend-specific parameters
-            component_spec = task_spec.metadata.get("component_spec", {})
-            design_requirements = task_spec.metadata.get("design_requirements", {})
-            framework = task_spec.metadata.get("framework", self.framework_preference)
+            params = {
+                "component_spec": task_spec.metadata.get("component_spec", {}),
+                "design_requirements": task_spec.metadata.get("design_requirements", {}),
+                "framework": task_spec.metadata.get("framework", self.framework_preference),
+            }
+            framework = params["framework"]
 
             # Determine task type and execute accordingly
-            if task_spec.task_type in ["component_development", "component_system"]:
-                result = await self._execute_component_development(
-                    task_spec, component_spec, framework, context
-                )
-            elif task_spec.task_type in ["responsive_design", "mobile_design"]:
-                result = await self._execute_responsive_design(
-                    task_spec, design_requirements, context
-                )
-            elif task_spec.task_type in ["ux_optimization", "accessibility"]:
-                result = await self._execute_ux_optimization(
-                    task_spec, design_requirements, context
-                )
-            elif task_spec.task_type in ["form_validation", "data_visualization"]:
-                result = await self._execute_feature_development(
-                    task_spec, component_spec, context
-                )
-            else:
-                result = await self._execute_general_frontend_task(
-                    task_spec, context
-                )
+            handler_name, param_names = self._TASK_HANDLERS.get(
+                task_spec.task_type, self._DEFAULT_TASK_HANDLER
+            )
+            handler = getattr(self, handler_name)
+            result = await handler(
+                task_spec, *[params[name] for name in param_names], context
+            )
 
             # Add execution metadata
             result.metadata.update({
                 "framework": framework,
                 "component_complexity": task_spec.complexity,
-                "development_duration": (datetime.utcnow() - task_start_time).total_seconds(),
+                "development_duration": (time.perf_counter_ns() - task_start_ns) / 1e9,
                 "frontend_version": "1.0.0"
             })
 
@@ -138,10 +464,7 @@ class FrontEndCoder(BaseAgent):
             framework
         )
 
-        messages = [{"role": "user", "content": component_prompt}]
-        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
-
-        claude_response = await self._call_claude(messages, system_prompt)
+        claude_response = await self._invoke_claude(component_prompt, context)
 
         # Generate component metadata
         component_metadata = {
@@ -177,18 +500,7 @@ class FrontEndCoder(BaseAgent):
             design_requirements
         )
 
-        messages = [{"role": "user", "content": responsive_prompt}]
-        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
-
-        claude_response = await self._call_claude(messages, system_prompt)
-
-        # Generate responsive design metadata
-        responsive_metadata = {
-            "breakpoints": ["320px", "768px", "1024px", "1200px"],
-            "approach": "mobile_first",
-            "technologies": ["flexbox", "grid", "media_queries"],
-            "compatibility": ["modern_browsers", "ie11+"]
-        }
+        claude_response = await self._invoke_claude(responsive_prompt, context)
 
         return self._create_task_result(
             task_id=task_spec.task_id,
@@ -197,7 +509,7 @@ class FrontEndCoder(BaseAgent):
             sources=[],
             metadata={
                 "development_method": "claude_responsive",
-                "responsive_metadata": responsive_metadata,
+                "responsive_metadata": dict(_RESPONSIVE_METADATA),
                 "task_type": "responsive_design"
             }
         )
@@ -215,17 +527,7 @@ class FrontEndCoder(BaseAgent):
             design_requirements
         )
 
-        messages = [{"role": "user", "content": ux_prompt}]
-        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
-
-        claude_response = await self._call_claude(messages, system_prompt)
-
-        # Generate UX metadata
-        ux_metadata = {
-            "accessibility_standard": "WCAG 2.1 AA",
-            "ux_principles": ["usability", "accessibility", "performance", "visual_hierarchy"],
-            "optimization_areas": ["navigation", "forms", "content", "interactions"]
-        }
+        claude_response = await self._invoke_claude(ux_prompt, context)
 
         return self._create_task_result(
             task_id=task_spec.task_id,
@@ -234,7 +536,7 @@ class FrontEndCoder(BaseAgent):
             sources=[],
             metadata={
                 "development_method": "claude_ux",
-                "ux_metadata": ux_metadata,
+                "ux_metadata": dict(_UX_METADATA),
                 "task_type": "ux_optimization"
             }
         )
@@ -247,17 +549,10 @@ class FrontEndCoder(BaseAgent):
     ) -> TaskResult:
         """Execute specialized feature development."""
         # Build feature development prompt based on task type
-        if task_spec.task_type == "form_validation":
-            feature_prompt = self._build_form_validation_prompt(task_spec.task, component_spec)
-        elif task_spec.task_type == "data_visualization":
-            feature_prompt = self._build_data_visualization_prompt(task_spec.task, component_spec)
-        else:
-            feature_prompt = self._build_general_feature_prompt(task_spec.task, component_spec)
-
-        messages = [{"role": "user", "content": feature_prompt}]
-        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
+        builder = self._FEATURE_PROMPT_BUILDERS.get(task_spec.task_type, "_build_general_feature_prompt")
+        feature_prompt = getattr(self, builder)(task_spec.task, component_spec)
 
-        claude_response = await self._call_claude(messages, system_prompt)
+        claude_response = await self._invoke_claude(feature_prompt, context)
 
         # Generate feature metadata
         feature_metadata = {
@@ -287,10 +582,7 @@ class FrontEndCoder(BaseAgent):
         # Build general frontend prompt
         general_prompt = self._build_general_frontend_prompt(task_spec.task)
 
-        messages = [{"role": "user", "content": general_prompt}]
-        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
-
-        claude_response = await self._call_claude(messages, system_prompt)
+        claude_response = await self._invoke_claude(general_prompt, context)
 
         return self._create_task_result(
             task_id=task_spec.task_id,
@@ -310,35 +602,7 @@ class FrontEndCoder(BaseAgent):
         framework: str
     ) -> str:
         """Build component development prompt."""
-        component_info = json.dumps(component_spec, indent=2)
-
-        return f"""
-Create a modern, production-ready {framework} component based on the following requirements:
-
-Task Description: {task_description}
-
-Component Specification:
-{component_info}
-
-Please provide:
-1. Complete component code with proper structure
-2. PropTypes/TypeScript interfaces (if applicable)
-3. Styling implementation (CSS modules, styled-components, or inline styles)
-4. Component documentation with usage examples
-5. Accessibility considerations (ARIA labels, keyboard navigation)
-6. State management (if applicable)
-7. Error handling and edge cases
-8. Unit test examples
-9. Responsive design considerations
-
-Requirements:
-- Follow modern {framework} best practices
-- Ensure accessibility compliance (WCAG 2.1 AA)
-- Include proper error handling
-- Make component reusable and maintainable
-- Add comprehensive comments
-- Consider performance optimizations
-"""
+        return _render_prompt(_COMPONENT_DEVELOPMENT_PROMPT, task_description, _format_spec(component_spec), framework)
 
     def _build_responsive_design_prompt(
         self,
@@ -346,34 +610,7 @@ Requirements:
         design_requirements: Dict[str, Any]
     ) -> str:
         """Build responsive design prompt."""
-        design_info = json.dumps(design_requirements, indent=2)
-
-        return f"""
-Implement a responsive design solution for the following requirements:
-
-Task Description: {task_description}
-
-Design Requirements:
-{design_info}
-
-Please provide:
-1. Mobile-first responsive CSS/SCSS implementation
-2. Breakpoint strategy and media queries
-3. Flexible layout using CSS Grid and Flexbox
-4. Responsive typography and spacing
-5. Image and media optimization
-6. Cross-browser compatibility considerations
-7. Touch-friendly interaction design
-8. Performance optimization techniques
-9. Progressive enhancement approach
-
-Requirements:
-- Support common screen sizes (mobile, tablet, desktop)
-- Use semantic HTML5 elements
-- Implement proper accessibility features
-- Optimize for performance and loading speed
-- Ensure touch interaction compatibility
-"""
+        return _render_prompt(_RESPONSIVE_DESIGN_PROMPT, task_description, _format_spec(design_requirements))
 
     def _build_ux_optimization_prompt(
         self,
@@ -381,34 +618,7 @@ Requirements:
         design_requirements: Dict[str, Any]
     ) -> str:
         """Build UX optimization prompt."""
-        design_info = json.dumps(design_requirements, indent=2)
-
-        return f"""
-Optimize the user experience for the following requirements:
-
-Task Description: {task_description}
-
-Design Requirements:
-{design_info}
-
-Please provide:
-1. User interface improvements based on UX principles
-2. Accessibility implementations (WCAG 2.1 AA compliance)
-3. Navigation and information architecture improvements
-4. Form usability enhancements
-5. Error handling and user feedback improvements
-6. Loading states and micro-interactions
-7. Performance optimizations for better UX
-8. Cognitive load reduction techniques
-9. A/B testing recommendations
-
-Requirements:
-- Follow established UX heuristics and principles
-- Ensure full accessibility compliance
-- Improve usability for all user groups
-- Provide clear user feedback and guidance
-- Optimize for user engagement and conversion
-"""
+        return _render_prompt(_UX_OPTIMIZATION_PROMPT, task_description, _format_spec(design_requirements))
 
     def _build_form_validation_prompt(
         self,
@@ -416,35 +626,7 @@ Requirements:
         form_spec: Dict[str, Any]
     ) -> str:
         """Build form validation prompt."""
-        form_info = json.dumps(form_spec, indent=2)
-
-        return f"""
-Create a comprehensive form validation system for the following requirements:
-
-Task Description: {task_description}
-
-Form Specification:
-{form_info}
-
-Please provide:
-1. Form component with validation logic
-2. Real-time validation feedback
-3. Custom validation rules and messages
-4. Error state handling and display
-5. Success state and submission handling
-6. Accessibility features for form inputs
-7. Mobile-optimized form layouts
-8. Progressive form enhancement
-9. Security considerations (CSRF, XSS protection)
-
-Requirements:
-- Validate on input and submission
-- Provide clear, helpful error messages
-- Support keyboard navigation
-- Ensure accessibility compliance
-- Handle edge cases gracefully
-- Optimize for mobile devices
-"""
+        return _render_prompt(_FORM_VALIDATION_PROMPT, task_description, _format_spec(form_spec))
 
     def _build_data_visualization_prompt(
         self,
@@ -452,35 +634,7 @@ Requirements:
         viz_spec: Dict[str, Any]
     ) -> str:
         """Build data visualization prompt."""
-        viz_info = json.dumps(viz_spec, indent=2)
-
-        return f"""
-Create an interactive data visualization component for the following requirements:
-
-Task Description: {task_description}
-
-Visualization Specification:
-{viz_info}
-
-Please provide:
-1. Interactive chart/graph component
-2. Data processing and transformation logic
-3. Responsive design for mobile and desktop
-4. Accessibility features for data visualization
-5. Loading states and error handling
-6. Interactive features (zoom, filter, export)
-7. Color scheme and styling for clarity
-8. Performance optimization for large datasets
-9. Cross-browser compatibility
-
-Requirements:
-- Use modern charting libraries (Chart.js, D3.js, etc.)
-- Ensure accessibility compliance
-- Optimize for performance with large datasets
-- Provide intuitive user interactions
-- Support responsive design
-- Include comprehensive error handling
-"""
+        return _render_prompt(_DATA_VISUALIZATION_PROMPT, task_description, _format_spec(viz_spec))
 
     def _build_general_feature_prompt(
         self,
@@ -488,105 +642,65 @@ Requirements:
         feature_spec: Dict[str, Any]
     ) -> str:
         """Build general feature development prompt."""
-        feature_info = json.dumps(feature_spec, indent=2)
-
-        return f"""
-Implement the frontend feature with the following requirements:
-
-Task Description: {task_description}
-
-Feature Specification:
-{feature_info}
-
-Please provide:
-1. Complete feature implementation
-2. Component structure and organization
-3. State management approach
-4. User interface and interaction design
-5. Error handling and edge cases
-6. Performance considerations
-7. Accessibility features
-8. Testing strategy and examples
-9. Documentation and usage examples
-
-Requirements:
-- Follow modern frontend best practices
-- Ensure accessibility compliance
-- Implement proper error handling
-- Optimize for performance
-- Provide clear documentation
-- Consider maintainability and scalability
-"""
+        return _render_prompt(_GENERAL_FEATURE_PROMPT, task_description, _format_spec(feature_spec))
 
     def _build_general_frontend_prompt(self, task_description: str) -> str:
         """Build general frontend development prompt."""
-        return f"""
-Implement the frontend solution for the following requirement:
+        return _render_prompt(_GENERAL_FRONTEND_PROMPT, task_description)
 
-Task Description: {task_description}
-
-Please provide:
-1. Complete frontend implementation
-2. Modern framework usage (React, Vue, or Angular)
-3. Responsive design implementation
-4. Component-based architecture
-5. State management approach
-6. Styling and design system
-7. Accessibility features
-8. Performance optimizations
-9. Testing considerations
-10. Documentation and usage examples
+    async def _invoke_claude(self, prompt: str, context: Optional[AgentContext]) -> str:
+        """Send a prompt to Claude with the context's system prompt or the default one."""
+        system_prompt = context.system_prompt if context else await self._get_default_system_prompt()
+        return await self._call_claude(self._make_user_messages(prompt), system_prompt)
 
-Requirements:
-- Use modern frontend frameworks and tools
-- Ensure mobile-responsive design
-- Follow accessibility best practices
-- Implement proper error handling
-- Optimize for performance and user experience
-- Provide clear, maintainable code
-"""
+    def _make_user_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Wrap a prompt as the single user message sent to Claude."""
+        return [{"role": "user", "content": prompt}]
 
     def _generate_component_dependencies(self, framework: str) -> List[str]:
         """Generate component dependencies based on framework."""
-        dependencies = {
-            "react": ["react", "prop-types"],
-            "vue": ["vue", "vue-router"],
-            "angular": ["@angular/core", "@angular/common"],
-            "svelte": ["svelte"]
-        }
+        return list(_FRAMEWORK_DEPENDENCIES.get(framework, ()) + self._styling_dependencies)
 
-        base_deps = dependencies.get(framework, [])
-        styling_deps = ["styled-components"] if self.component_library == "styled-components" else []
-
-        return base_deps + styling_deps
+    async def _call_claude(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """Call Claude, keeping at most claude_concurrency requests in flight."""
+        if not self.claude_cache_size:
+            async with self._claude_semaphore:
+                return await super()._call_claude(messages, system_prompt)
+
+        cache_key = (
+            system_prompt,
+            tuple((message["role"], message["content"]) for message in messages)
+        )
+        cached = self.claude_cache.get(cache_key)
+        if cached is not None:
+            self.claude_cache.move_to_end(cache_key)
+            return cached
 
-    async def _get_default_system_prompt(self) -> str:
-        """Get default system prompt for frontend coder."""
-        return """You are a specialized frontend developer focused on creating modern, responsive user interfaces. Your expertise includes:
+        async with self._claude_semaphore:
+            response = await super()._call_claude(messages, system_prompt)
 
-## Core Capabilities
-- Modern frontend framework development (React, Vue, Angular)
-- Responsive design and mobile-first development
-- Component-based architecture and reusability
-- Performance optimization and user experience
+        self._update_claude_cache(cache_key, response)
+        return response
 
-## Development Standards
-1. **Modern Frameworks**: Use current best practices and patterns
-2. **Responsive Design**: Ensure compatibility across devices
-3. **Component Architecture**: Build reusable, maintainable components
-4. **Performance**: Optimize for fast loading and smooth interactions
+    def _update_claude_cache(
+        self,
+        cache_key: Tuple[Optional[str], Tuple[Tuple[str, str], ...]],
+        response: str
+    ):
+        """Update Claude response cache with LRU eviction."""
+        if cache_key in self.claude_cache:
+            del self.claude_cache[cache_key]
 
-## Quality Standards
-- Write clean, maintainable, and well-documented code
-- Follow accessibility standards (WCAG 2.1 AA)
-- Ensure cross-browser compatibility
-- Implement proper error handling and validation
+        self.claude_cache[cache_key] = response
 
-## Technology Stack
-- HTML5, CSS3, JavaScript/TypeScript
-- Modern frontend frameworks
-- Build tools and development environments
-- Testing frameworks and CI/CD integration
+        # Evict oldest entries if cache is full
+        while len(self.claude_cache) > self.claude_cache_size:
+            self.claude_cache.popitem(last=False)
 
-## Current Task
-Focus on creating high-quality, production-ready frontend components with modern best practices."""
\ No newline at end of file
+    async def _get_default_system_prompt(self) -> str:
+        """Get default system prompt for frontend coder."""
+        return _DEFAULT_SYSTEM_PROMPT
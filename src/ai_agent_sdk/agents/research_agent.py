@@ -6,15 +6,139 @@ knowledge synthesis, and competitive analysis.
 """
 
 import asyncio
-import json
-from typing import Dict, List, Optional, Any, Set
+import copy
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
-from .base_agent import BaseAgent, TaskResult
+from .base_agent import BaseAgent, TaskResult, _dumps_indented
 from ..core.rules_engine import TaskSpec
 from ..core.context_manager import AgentContext
 from ..core.exceptions import TaskExecutionError, MCPServerError
 
+logger = logging.getLogger(__name__)
+
+# (task, task_type, complexity, project_id, system prompt or None)
+_ResearchCacheKey = Tuple[str, str, int, Optional[str], Optional[str]]
+
+
+# Source fields kept when a Perplexity payload is embedded in a prompt
+_PROMPT_SOURCE_FIELDS = ("url", "title", "snippet")
+# Longest source snippet embedded in a prompt, in characters
+_MAX_PROMPT_SNIPPET_CHARS = 400
+
+# Task types handled directly, in addition to those of each capability
+_SUPPORTED_TASK_TYPES = frozenset({
+    "market_research", "competitive_research", "technology_research",
+    "academic_research", "industry_analysis", "trend_analysis",
+    "knowledge_synthesis", "source_verification"
+})
+
+# System prompt used when a task arrives without an agent context
+_DEFAULT_SYSTEM_PROMPT = """You are a specialized research agent focused on comprehensive research and knowledge synthesis. Your expertise includes:
+
+## Core Capabilities
+- Comprehensive market research and competitive intelligence
+- Multi-source information gathering and verification
+- Knowledge synthesis and trend analysis
+- Source attribution and confidence scoring
+
+## Research Methodology
+1. **Multi-source Research**: Gather information from diverse, credible sources
+2. **Source Verification**: Cross-reference findings across multiple sources
+3. **Trend Analysis**: Identify patterns and trends in the data
+4. **Knowledge Synthesis**: Combine findings into actionable insights
+
+## Quality Standards
+- Always provide source attribution with credibility scores
+- Include confidence scoring for all findings
+- Highlight assumptions and limitations
+- Ensure recommendations are data-driven and evidence-based
+
+## Current Task
+Focus on conducting thorough research with proper source attribution and confidence scoring."""
+
+# Prompt templates, formatted with the research query and serialized data
+_SYNTHESIS_PROMPT = """
+Based on the following research data, provide a comprehensive {analysis_type} for the query: "{query}"
+
+Research Data:
+{data}
+
+Please synthesize this information into:
+1. Key findings and insights
+2. Actionable recommendations
+3. Important trends and patterns
+4. Risk factors and considerations
+5. Next steps for further investigation
+
+Ensure your response is well-structured, data-driven, and provides specific, actionable insights.
+"""
+
+_TECHNOLOGY_SYNTHESIS_PROMPT = """
+Analyze the following technology research data for the query: "{query}"
+
+Research Data:
+{data}
+
+Provide a comprehensive technology analysis including:
+1. Technology landscape overview
+2. Key players and solutions
+3. Technical trends and innovations
+4. Implementation considerations
+5. Competitive advantages and disadvantages
+6. Recommendations for adoption or further investigation
+
+Focus on technical accuracy, practical insights, and actionable recommendations.
+"""
+
+_KNOWLEDGE_SYNTHESIS_PROMPT = """
+Synthesize the following multiple research sources to provide comprehensive insights for: "{query}"
+
+Research Data:
+{data}
+
+Create a synthesized analysis that:
+1. Integrates findings from all sources
+2. Identifies consensus and conflicting information
+3. Highlights key themes and patterns
+4. Provides a cohesive narrative
+5. Offers evidence-based conclusions
+6. Suggests areas for further research
+
+Ensure all claims are properly attributed to sources where possible.
+"""
+
+_GENERAL_RESEARCH_PROMPT = """
+Conduct comprehensive research on the following topic: "{query}"
+
+Please provide:
+1. Overview and background information
+2. Key findings and current state
+3. Important trends and developments
+4. Challenges and opportunities
+5. Relevant data and statistics
+6. Sources and references (when possible)
+
+Focus on providing accurate, well-structured information with proper attribution where available.
+"""
+
+
+@lru_cache(maxsize=256)
+def _research_queries(topic: str) -> Tuple[str, ...]:
+    """Build the research queries for a topic, reusing them for repeated topics."""
+    # Simple query generation - could be made more sophisticated
+    return (
+        f"{topic} overview and current state",
+        f"{topic} challenges and opportunities",
+        f"{topic} future trends and predictions"
+    )
+
 
 class ResearchAgent(BaseAgent):
     """
@@ -22,11 +146,30 @@ class ResearchAgent(BaseAgent):
     Handles web research, knowledge synthesis, and competitive analysis.
     """
 
+    # Handler for each task type; other types go to _execute_general_research
+    _TASK_HANDLERS = {
+        "competitive_research": "_execute_competitive_research",
+        "market_analysis": "_execute_competitive_research",
+        "technology_research": "_execute_technology_research",
+        "academic_research": "_execute_technology_research",
+        "knowledge_synthesis": "_execute_knowledge_synthesis",
+        "research_synthesis": "_execute_knowledge_synthesis",
+    }
+
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize ResearchAgent."""
         super().__init__(agent_type="research", config=config)
         self.max_sources = self.config.get("max_sources", 20)
         self.research_timeout = self.config.get("research_timeout", 300)
+        self.mcp_concurrency = self.config.get("mcp_concurrency", 5)
+        self._mcp_semaphore = asyncio.Semaphore(self.mcp_concurrency)
+        # In-flight Perplexity requests, shared by callers asking the same thing
+        self._pending_research: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        # Results reused for repeated (task, task_type, complexity) requests;
+        # a cache size of 0 disables caching
+        self.research_cache_size = self.config.get("research_cache_size", 100)
+        self.research_cache_ttl = self.config.get("research_cache_ttl", 900)
+        self.research_cache: OrderedDict[_ResearchCacheKey, Tuple[float, TaskResult]] = OrderedDict()
 
     async def _initialize_capabilities(self):
         """Initialize research agent capabilities."""
@@ -58,11 +201,7 @@ class ResearchAgent(BaseAgent):
         )
 
         # Task types specifically supported
-        self.supported_task_types.update({
-            "market_research", "competitive_research", "technology_research",
-            "academic_research", "industry_analysis", "trend_analysis",
-            "knowledge_synthesis", "source_verification"
-        })
+        self.supported_task_types |= _SUPPORTED_TASK_TYPES
 
     async def _execute_task_internal(
         self,
@@ -70,32 +209,94 @@ class ResearchAgent(BaseAgent):
         context: Optional[AgentContext]
     ) -> TaskResult:
         """Execute research task with Perplexity MCP integration."""
-        task_start_time = datetime.utcnow()
+        task_start_time = time.perf_counter()
+
+        # Results depend on the project and the agent context's system prompt too
+        cache_key = (
+            task_spec.task,
+            task_spec.task_type,
+            task_spec.complexity,
+            task_spec.project_id,
+            context.system_prompt if context else None
+        )
+        cached = self._get_cached_result(cache_key, task_spec, task_start_time)
+        if cached is not None:
+            return cached
 
         try:
             # Determine research approach based on task type
-            if task_spec.task_type in ["competitive_research", "market_analysis"]:
-                result = await self._execute_competitive_research(task_spec, context)
-            elif task_spec.task_type in ["technology_research", "academic_research"]:
-                result = await self._execute_technology_research(task_spec, context)
-            elif task_spec.task_type in ["knowledge_synthesis", "research_synthesis"]:
-                result = await self._execute_knowledge_synthesis(task_spec, context)
-            else:
-                result = await self._execute_general_research(task_spec, context)
-
-            # Add execution metadata
-            result.metadata.update({
-                "research_method": result.metadata.get("research_method", "general"),
-                "sources_count": len(result.sources),
-                "complexity_level": task_spec.complexity,
-                "research_duration": (datetime.utcnow() - task_start_time).total_seconds()
-            })
-
+            handler = getattr(
+                self, self._TASK_HANDLERS.get(task_spec.task_type, "_execute_general_research")
+            )
+            result = await handler(task_spec, context)
+
+            # Add execution metadata in place
+            metadata = result.metadata
+            metadata.setdefault("research_method", "general")
+            metadata["sources_count"] = len(result.sources)
+            metadata["complexity_level"] = task_spec.complexity
+            metadata["research_duration"] = time.perf_counter() - task_start_time
+
+            # Fallback results reflect a transient MCP outage; don't pin them for the TTL
+            if not metadata.get("fallback_used"):
+                self._update_research_cache(cache_key, result)
             return result
 
         except Exception as e:
             raise TaskExecutionError(f"Research task execution failed: {e}") from e
 
+    def _get_cached_result(
+        self,
+        cache_key: _ResearchCacheKey,
+        task_spec: TaskSpec,
+        task_start_time: float
+    ) -> Optional[TaskResult]:
+        """Return a copy of a fresh cached result for this task, if any."""
+        if not self.research_cache_size:
+            return None
+
+        cached = self.research_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        cached_at, result = cached
+        if time.monotonic() - cached_at > self.research_cache_ttl:
+            del self.research_cache[cache_key]
+            return None
+
+        self.research_cache.move_to_end(cache_key)
+
+        metadata = copy.deepcopy(result.metadata)
+        metadata["research_duration"] = time.perf_counter() - task_start_time
+
+        return replace(
+            result,
+            task_id=task_spec.task_id,
+            sources=list(result.sources),
+            metadata=metadata,
+            created_at=datetime.utcnow()
+        )
+
+    def _update_research_cache(self, cache_key: _ResearchCacheKey, result: TaskResult):
+        """Update research result cache with LRU eviction."""
+        if not self.research_cache_size:
+            return
+
+        if cache_key in self.research_cache:
+            del self.research_cache[cache_key]
+
+        # Store a snapshot so later changes to the returned result don't leak in
+        snapshot = replace(
+            result,
+            sources=list(result.sources),
+            metadata=copy.deepcopy(result.metadata)
+        )
+        self.research_cache[cache_key] = (time.monotonic(), snapshot)
+
+        # Evict oldest entries if cache is full
+        while len(self.research_cache) > self.research_cache_size:
+            self.research_cache.popitem(last=False)
+
     async def _execute_competitive_research(
         self,
         task_spec: TaskSpec,
@@ -109,11 +310,12 @@ class ResearchAgent(BaseAgent):
                 complexity_level=self._map_complexity_level(task_spec.complexity),
                 research_mode="competitive"
             )
+            perplexity_data = self._project_perplexity(perplexity_result)
 
             # Synthesize findings with Claude
             synthesis_prompt = self._build_synthesis_prompt(
                 task_spec.task,
-                perplexity_result,
+                perplexity_data,
                 "competitive_analysis"
             )
 
@@ -138,14 +340,14 @@ class ResearchAgent(BaseAgent):
                 sources=sources,
                 metadata={
                     "research_method": "perplexity_mcp",
-                    "perplexity_data": perplexity_result,
+                    "perplexity_data": perplexity_data,
                     "analysis_type": "competitive"
                 }
             )
 
         except MCPServerError as e:
             # Fallback to general research
-            print(f"Perplexity MCP unavailable, using fallback research: {e}")
+            logger.warning("Perplexity MCP unavailable, using fallback research: %s", e)
             return await self._execute_general_research(task_spec, context)
 
     async def _execute_technology_research(
@@ -161,11 +363,12 @@ class ResearchAgent(BaseAgent):
                 complexity_level=self._map_complexity_level(task_spec.complexity),
                 research_mode="technical"
             )
+            perplexity_data = self._project_perplexity(perplexity_result)
 
             # Build technology-focused synthesis prompt
             synthesis_prompt = self._build_technology_synthesis_prompt(
                 task_spec.task,
-                perplexity_result
+                perplexity_data
             )
 
             messages = [
@@ -189,14 +392,14 @@ class ResearchAgent(BaseAgent):
                 sources=sources,
                 metadata={
                     "research_method": "perplexity_technical",
-                    "perplexity_data": perplexity_result,
+                    "perplexity_data": perplexity_data,
                     "analysis_type": "technology"
                 }
             )
 
         except MCPServerError as e:
             # Fallback to general research
-            print(f"Perplexity MCP unavailable, using fallback research: {e}")
+            logger.warning("Perplexity MCP unavailable, using fallback research: %s", e)
             return await self._execute_general_research(task_spec, context)
 
     async def _execute_knowledge_synthesis(
@@ -208,23 +411,30 @@ class ResearchAgent(BaseAgent):
         # Break down the task into research queries
         research_queries = self._generate_research_queries(task_spec.task)
 
-        all_sources = []
+        source_lists = []
         research_data = []
 
-        # Execute research queries
-        for query in research_queries:
-            try:
-                result = await self._call_perplexity_research(
+        # Execute research queries concurrently
+        results = await asyncio.gather(
+            *[
+                self._call_perplexity_research(
                     query=query,
                     complexity_level="medium",
                     research_mode="comprehensive"
                 )
-                research_data.append(result)
-                all_sources.extend(self._extract_sources_from_perplexity(result))
+                for query in research_queries
+            ],
+            return_exceptions=True
+        )
 
-            except MCPServerError:
+        for result in results:
+            if isinstance(result, MCPServerError):
                 # Skip this query if Perplexity is unavailable
                 continue
+            if isinstance(result, BaseException):
+                raise result
+            research_data.append(self._project_perplexity(result))
+            source_lists.append(self._extract_sources_from_perplexity(result))
 
         # Synthesize all research data
         synthesis_prompt = self._build_knowledge_synthesis_prompt(
@@ -243,20 +453,25 @@ class ResearchAgent(BaseAgent):
 
         claude_response = await self._call_claude(messages, system_prompt)
 
-        # Remove duplicate sources
-        unique_sources = list(set(all_sources))
+        # Flatten and remove duplicate sources, keeping first-seen order
+        unique_sources = list(dict.fromkeys(chain.from_iterable(source_lists)))
+
+        metadata = {
+            "research_method": "knowledge_synthesis",
+            "queries_executed": len(research_queries),
+            "sources_count": len(unique_sources),
+            "analysis_type": "synthesis"
+        }
+        if len(research_data) < len(research_queries):
+            # Some queries were skipped while Perplexity was unavailable
+            metadata["fallback_used"] = True
 
         return self._create_task_result(
             task_id=task_spec.task_id,
             content=claude_response,
             confidence_score=0.90,
             sources=unique_sources,
-            metadata={
-                "research_method": "knowledge_synthesis",
-                "queries_executed": len(research_queries),
-                "sources_count": len(unique_sources),
-                "analysis_type": "synthesis"
-            }
+            metadata=metadata
         )
 
     async def _execute_general_research(
@@ -300,16 +515,29 @@ class ResearchAgent(BaseAgent):
         complexity_level: str = "medium",
         research_mode: str = "comprehensive"
     ) -> Dict[str, Any]:
-        """Call Perplexity MCP server for research."""
-        params = {
-            "query": query,
-            "complexity_level": complexity_level,
-            "research_mode": research_mode,
-            "max_sources": self.max_sources,
-            "include_analysis": True
-        }
+        """Call Perplexity MCP server for research, joining an identical in-flight request."""
+        request_key = (query, complexity_level, research_mode)
+        request = self._pending_research.get(request_key)
+
+        if request is None:
+            params = {
+                "query": query,
+                "complexity_level": complexity_level,
+                "research_mode": research_mode,
+                "max_sources": self.max_sources,
+                "include_analysis": True
+            }
+            request = asyncio.ensure_future(self._request_perplexity_research(params))
+            self._pending_research[request_key] = request
+            request.add_done_callback(lambda _: self._pending_research.pop(request_key, None))
 
-        return await self._call_mcp_server("perplexity", "research", params)
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(request)
+
+    async def _request_perplexity_research(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one research request to the Perplexity MCP server."""
+        async with self._mcp_semaphore:
+            return await self._call_mcp_server("perplexity", "research", params)
 
     def _map_complexity_level(self, complexity: int) -> str:
         """Map task complexity to Perplexity complexity level."""
@@ -327,21 +555,11 @@ class ResearchAgent(BaseAgent):
         analysis_type: str
     ) -> str:
         """Build synthesis prompt for Claude."""
-        return f"""
-Based on the following research data, provide a comprehensive {analysis_type} for the query: "{original_query}"
-
-Research Data:
-{json.dumps(perplexity_data, indent=2)}
-
-Please synthesize this information into:
-1. Key findings and insights
-2. Actionable recommendations
-3. Important trends and patterns
-4. Risk factors and considerations
-5. Next steps for further investigation
-
-Ensure your response is well-structured, data-driven, and provides specific, actionable insights.
-"""
+        return _SYNTHESIS_PROMPT.format(
+            analysis_type=analysis_type,
+            query=original_query,
+            data=_dumps_indented(perplexity_data)
+        )
 
     def _build_technology_synthesis_prompt(
         self,
@@ -349,22 +567,10 @@ Ensure your response is well-structured, data-driven, and provides specific, act
         perplexity_data: Dict[str, Any]
     ) -> str:
         """Build technology-focused synthesis prompt."""
-        return f"""
-Analyze the following technology research data for the query: "{original_query}"
-
-Research Data:
-{json.dumps(perplexity_data, indent=2)}
-
-Provide a comprehensive technology analysis including:
-1. Technology landscape overview
-2. Key players and solutions
-3. Technical trends and innovations
-4. Implementation considerations
-5. Competitive advantages and disadvantages
-6. Recommendations for adoption or further investigation
-
-Focus on technical accuracy, practical insights, and actionable recommendations.
-"""
+        return _TECHNOLOGY_SYNTHESIS_PROMPT.format(
+            query=original_query,
+            data=_dumps_indented(perplexity_data)
+        )
 
     def _build_knowledge_synthesis_prompt(
         self,
@@ -377,54 +583,60 @@ Focus on technical accuracy, practical insights, and actionable recommendations.
             "research_results": research_data
         }
 
-        return f"""
-Synthesize the following multiple research sources to provide comprehensive insights for: "{original_query}"
+        return _KNOWLEDGE_SYNTHESIS_PROMPT.format(
+            query=original_query,
+            data=_dumps_indented(combined_data)
+        )
 
-Research Data:
-{json.dumps(combined_data, indent=2)}
+    def _project_perplexity(self, perplexity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Trim a Perplexity payload's sources to the fields synthesis prompts use."""
+        results = perplexity_data.get("results") if isinstance(perplexity_data, dict) else None
+        if not isinstance(results, dict) or not isinstance(results.get("sources"), list):
+            return perplexity_data
 
-Create a synthesized analysis that:
-1. Integrates findings from all sources
-2. Identifies consensus and conflicting information
-3. Highlights key themes and patterns
-4. Provides a cohesive narrative
-5. Offers evidence-based conclusions
-6. Suggests areas for further research
+        sources = []
+        for source in results["sources"][:self.max_sources]:
+            if isinstance(source, dict):
+                source = {key: source[key] for key in _PROMPT_SOURCE_FIELDS if key in source}
+                snippet = source.get("snippet")
+                if isinstance(snippet, str) and len(snippet) > _MAX_PROMPT_SNIPPET_CHARS:
+                    source["snippet"] = snippet[:_MAX_PROMPT_SNIPPET_CHARS]
+            sources.append(source)
 
-Ensure all claims are properly attributed to sources where possible.
-"""
+        return {**perplexity_data, "results": {**results, "sources": sources}}
 
     def _build_general_research_prompt(self, query: str) -> str:
         """Build general research prompt for Claude."""
-        return f"""
-Conduct comprehensive research on the following topic: "{query}"
-
-Please provide:
-1. Overview and background information
-2. Key findings and current state
-3. Important trends and developments
-4. Challenges and opportunities
-5. Relevant data and statistics
-6. Sources and references (when possible)
-
-Focus on providing accurate, well-structured information with proper attribution where available.
-"""
+        return _GENERAL_RESEARCH_PROMPT.format(query=query)
 
     def _extract_sources_from_perplexity(self, perplexity_data: Dict[str, Any]) -> List[str]:
         """Extract sources from Perplexity research data."""
         sources = []
+        append = sources.append
+        max_sources = self.max_sources
 
         if "results" in perplexity_data:
             results = perplexity_data["results"]
             if "sources" in results:
-                for source in results["sources"]:
+                raw_sources = results["sources"]
+
+                # Fast path for the usual payload shape: every source has a url
+                try:
+                    return [source["url"] for source in raw_sources[:max_sources]]
+                except (TypeError, KeyError):
+                    pass
+
+                for source in raw_sources:
+                    # Sources beyond the configured cap are never used
+                    if len(sources) >= max_sources:
+                        break
                     if isinstance(source, dict):
                         if "url" in source:
-                            sources.append(source["url"])
+                            append(source["url"])
                         elif "title" in source:
-                            sources.append(source["title"])
+                            append(source["title"])
                     elif isinstance(source, str):
-                        sources.append(source)
+                        append(source)
 
         return sources
 
@@ -438,35 +650,8 @@ Focus on providing accurate, well-structured information with proper attribution
 
     def _generate_research_queries(self, topic: str) -> List[str]:
         """Generate multiple research queries for comprehensive coverage."""
-        # Simple query generation - could be made more sophisticated
-        queries = [
-            f"{topic} overview and current state",
-            f"{topic} challenges and opportunities",
-            f"{topic} future trends and predictions"
-        ]
-        return queries
+        return list(_research_queries(topic))
 
     async def _get_default_system_prompt(self) -> str:
         """Get default system prompt for research agent."""
-        return """You are a specialized research agent focused on comprehensive research and knowledge synthesis. Your expertise includes:
-
-## Core Capabilities
-- Comprehensive market research and competitive intelligence
-- Multi-source information gathering and verification
-- Knowledge synthesis and trend analysis
-- Source attribution and confidence scoring
-
-## Research Methodology
-1. **Multi-source Research**: Gather information from diverse, credible sources
-2. **Source Verification**: Cross-reference findings across multiple sources
-3. **Trend Analysis**: Identify patterns and trends in the data
-4. **Knowledge Synthesis**: Combine findings into actionable insights
-
-## Quality Standards
-- Always provide source attribution with credibility scores
-- Include confidence scoring for all findings
-- Highlight assumptions and limitations
-- Ensure recommendations are data-driven and evidence-based
-
-## Current Task
-Focus on conducting thorough research with proper source attribution and confidence scoring."""
\ No newline at end of file
+        return _DEFAULT_SYSTEM_PROMPT
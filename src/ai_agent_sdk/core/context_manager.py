@@ -7,25 +7,109 @@ Implements hot-reload capabilities and caching for optimal performance.
 
 import asyncio
 import hashlib
+import importlib.resources
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Union
-from dataclasses import dataclass, field
-from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from dataclasses import dataclass, field, replace
 import json
 import threading
 import logging
 
 from .exceptions import ConfigurationError, ValidationError
 
+# Native inotify events (Linux); the ctypes bindings fail to load elsewhere
+try:
+    from asyncinotify import Inotify, Mask
+    ASYNCINOTIFY_AVAILABLE = True
+except (ImportError, AttributeError, OSError):
+    ASYNCINOTIFY_AVAILABLE = False
+    Inotify = None
+    Mask = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a prompt file must stay unchanged before it is reloaded
+_RELOAD_DEBOUNCE_DELAY = 0.2
+
+# Prompt files smaller than this (bytes) are read on the event loop
+_INLINE_READ_LIMIT = 64 * 1024
+
+# Default prompts shipped under ai_agent_sdk/resources/prompts
+_DEFAULT_PROMPT_FILES = (
+    "team_leader.md",
+    "research_agent.md",
+    "codebase_analyzer.md",
+    "frontend_coder.md",
+    "backend_coder.md",
+)
+
+# Sections every prompt file must mention
+_REQUIRED_SECTIONS = ("role", "capabilities")
+
+
+# Read-only, binary on Windows, and without atime updates where supported
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _open_prompt_fd(path: Path) -> int:
+    """Open a prompt file for reading, skipping the atime update when permitted."""
+    if _O_NOATIME:
+        try:
+            return os.open(path, _READ_FLAGS | _O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is only allowed for the file's owner
+            pass
+    return os.open(path, _READ_FLAGS)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read a file descriptor to EOF, expecting about ``size`` bytes."""
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data
+
+    # The file grew after it was stat-ed; read the rest
+    chunks = [data]
+    while chunk := os.read(fd, _INLINE_READ_LIMIT):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _read_prompt_file(
+    path: Path,
+    max_size: Optional[int] = None
+) -> Tuple[Optional[bytes], Tuple[int, int]]:
+    """
+    Read a prompt file, stat-ing it first so a concurrent write forces a reload.
+
+    Returns:
+        The file's bytes, or None if it is at least ``max_size`` bytes long,
+        and its (st_mtime_ns, st_size) signature
+    """
+    fd = _open_prompt_fd(path)
+    try:
+        stat = os.fstat(fd)
+        file_signature = (stat.st_mtime_ns, stat.st_size)
+        if max_size is not None and stat.st_size >= max_size:
+            return None, file_signature
+        return _read_fd(fd, stat.st_size), file_signature
+    finally:
+        os.close(fd)
+
+
+def _parse_prompt_stem(stem: str) -> Tuple[str, Optional[str]]:
+    """Split a prompt file stem into (agent_type, task_type)."""
+    parts = stem.split("_", 2)
+    return parts[0], parts[1] if len(parts) > 1 else None
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemPrompt:
     """System prompt data structure."""
     agent_type: str
@@ -36,9 +120,11 @@ class SystemPrompt:
     checksum: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     last_modified: datetime = field(default_factory=datetime.utcnow)
+    # (st_mtime_ns, st_size) of the file when it was read
+    file_signature: Optional[Tuple[int, int]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentContext:
     """Context provided to agents for task execution."""
     system_prompt: str
@@ -52,19 +138,32 @@ class AgentContext:
 class FileWatcher:
     """Simple file watcher implementation without external dependencies."""
 
-    def __init__(self, context_manager: "ContextManager", check_interval: float = 1.0):
+    def __init__(
+        self,
+        context_manager: "ContextManager",
+        check_interval: float = 1.0,
+        debounce_delay: float = _RELOAD_DEBOUNCE_DELAY
+    ):
         self.context_manager = context_manager
         self.check_interval = check_interval
+        self.debounce_delay = debounce_delay
         self.watching = False
         self._watch_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._file_mtimes: Dict[str, float] = {}
+        self._file_signatures: Dict[str, Tuple[int, int]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Pending debounced reloads, keyed by file path (event loop thread only)
+        self._pending: Dict[str, asyncio.TimerHandle] = {}
+        # Running reloads; the loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
 
     def start_watching(self, directory: Union[str, Path]):
         """Start watching directory for changes."""
         if self.watching:
             return
 
+        # Reloads run on the loop that started the watcher
+        self._loop = asyncio.get_running_loop()
         self.watching = True
         self._stop_event.clear()
         self._watch_thread = threading.Thread(
@@ -73,7 +172,7 @@ class FileWatcher:
             daemon=True
         )
         self._watch_thread.start()
-        logger.info(f"Started watching directory: {directory}")
+        logger.info("Started watching directory: %s", directory)
 
     def stop_watching(self):
         """Stop watching directory."""
@@ -84,6 +183,7 @@ class FileWatcher:
         self._stop_event.set()
         if self._watch_thread and self._watch_thread.is_alive():
             self._watch_thread.join(timeout=2.0)
+        self._cancel_reloads()
         logger.info("Stopped watching directory")
 
     def _watch_loop(self, directory: Path):
@@ -93,30 +193,137 @@ class FileWatcher:
                 self._check_directory_changes(directory)
                 time.sleep(self.check_interval)
             except Exception as e:
-                logger.error(f"Error in file watcher: {e}")
+                logger.error("Error in file watcher: %s", e)
 
     def _check_directory_changes(self, directory: Path):
         """Check for file changes in directory."""
         if not directory.exists():
             return
 
-        for file_path in directory.glob("*.md"):
-            try:
-                current_mtime = file_path.stat().st_mtime
-                file_path_str = str(file_path)
-
-                if file_path_str in self._file_mtimes:
-                    if current_mtime > self._file_mtimes[file_path_str]:
+        seen: Set[str] = set()
+        added = False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Same selection as glob("*.md"), which skips dotfiles
+                if entry.name.startswith(".") or not entry.name.endswith(".md"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    current_signature = (stat.st_mtime_ns, stat.st_size)
+                    file_path_str = entry.path
+                    seen.add(file_path_str)
+
+                    previous_signature = self._file_signatures.get(file_path_str)
+                    if previous_signature is None:
+                        added = True
+                    elif current_signature != previous_signature:
                         # File modified
-                        logger.info(f"File modified: {file_path}")
-                        asyncio.create_task(
-                            self.context_manager._reload_prompt_file(file_path_str)
-                        )
+                        logger.info("File modified: %s", file_path_str)
+                        self._loop.call_soon_threadsafe(self._schedule_reload, file_path_str)
+
+                    self._file_signatures[file_path_str] = current_signature
+
+                except Exception as e:
+                    logger.error("Error checking file %s: %s", entry.path, e)
+
+        removed = self._file_signatures.keys() - seen
+        for file_path_str in removed:
+            del self._file_signatures[file_path_str]
+
+        # Files appearing or disappearing can change which file a prompt resolves to
+        if added or removed:
+            self._loop.call_soon_threadsafe(self.context_manager._invalidate_prompt_locations)
+
+    def _cancel_reloads(self):
+        """Cancel debounced and running reloads."""
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _schedule_reload(self, file_path: str):
+        """(Re)start the debounce timer for a modified file."""
+        handle = self._pending.pop(file_path, None)
+        if handle is not None:
+            handle.cancel()
+        self._pending[file_path] = self._loop.call_later(
+            self.debounce_delay, self._fire_reload, file_path
+        )
 
-                self._file_mtimes[file_path_str] = current_mtime
+    def _fire_reload(self, file_path: str):
+        """Reload a file once its changes have settled."""
+        del self._pending[file_path]
+        task = self._loop.create_task(self.context_manager._reload_prompt_file(file_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-            except Exception as e:
-                logger.error(f"Error checking file {file_path}: {e}")
+
+class InotifyFileWatcher(FileWatcher):
+    """File watcher driven by Linux inotify events instead of polling."""
+
+    def __init__(
+        self,
+        context_manager: "ContextManager",
+        debounce_delay: float = _RELOAD_DEBOUNCE_DELAY
+    ):
+        super().__init__(context_manager, debounce_delay=debounce_delay)
+        self._watch_task: Optional[asyncio.Task] = None
+
+    def start_watching(self, directory: Union[str, Path]):
+        """Start watching directory for changes."""
+        if self.watching:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self.watching = True
+        self._watch_task = self._loop.create_task(self._watch_events(Path(directory)))
+        logger.info("Started watching directory: %s", directory)
+
+    def stop_watching(self):
+        """Stop watching directory."""
+        if not self.watching:
+            return
+
+        self.watching = False
+        if self._watch_task:
+            self._watch_task.cancel()
+        self._cancel_reloads()
+        logger.info("Stopped watching directory")
+
+    async def _watch_events(self, directory: Path):
+        """Consume inotify events for prompt files on the event loop."""
+        membership_mask = Mask.CREATE | Mask.DELETE | Mask.MOVED_FROM | Mask.MOVED_TO
+        written_mask = Mask.CLOSE_WRITE | Mask.MOVED_TO
+        try:
+            with Inotify() as inotify:
+                inotify.add_watch(directory, membership_mask | written_mask)
+                async for event in inotify:
+                    # Same selection as glob("*.md"), which skips dotfiles
+                    name = str(event.name) if event.name else ""
+                    if name.startswith(".") or not name.endswith(".md"):
+                        continue
+
+                    # Files appearing or disappearing can change which file a prompt resolves to
+                    if event.mask & membership_mask:
+                        self.context_manager._invalidate_prompt_locations()
+
+                    if event.mask & written_mask:
+                        logger.info("File modified: %s", event.path)
+                        self._schedule_reload(str(event.path))
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # e.g. the inotify watch limit was hit; keep hot reload alive by polling
+            logger.error("Error in file watcher, falling back to polling: %s", e)
+            # This task is ending on its own, so there is nothing to cancel
+            self._watch_task = None
+            self.stop_watching()
+            self.context_manager._fall_back_to_polling()
 
 
 class ContextManager:
@@ -128,8 +335,11 @@ class ContextManager:
     def __init__(self, prompts_dir: str = "system_prompts"):
         """Initialize context manager."""
         self.prompts_dir = Path(prompts_dir)
-        self.prompt_cache: OrderedDict[str, SystemPrompt] = OrderedDict()
+        # Plain dicts keep insertion order, which serves as LRU order here
+        self.prompt_cache: Dict[str, SystemPrompt] = {}
         self.context_cache: Dict[str, AgentContext] = {}
+        # (agent_type, task_type) -> (prompt file, cache key), cleared when files come or go
+        self._prompt_locations: Dict[Tuple[str, Optional[str]], Tuple[Path, str]] = {}
         self.max_cache_size = 1000
         self.file_watcher: Optional[FileWatcher] = None
         self.watching = False
@@ -166,20 +376,34 @@ class ContextManager:
             ConfigurationError: If prompt file is not found
             ValidationError: If prompt content is invalid
         """
-        prompt_file = self._get_prompt_file(agent_type, task_type)
-        cache_key = self._get_cache_key(agent_type, task_type)
+        system_prompt = await self._load_system_prompt(agent_type, task_type, force_reload)
+        return system_prompt.content
+
+    async def _load_system_prompt(
+        self,
+        agent_type: str,
+        task_type: Optional[str] = None,
+        force_reload: bool = False
+    ) -> SystemPrompt:
+        """Load the cached or freshly read SystemPrompt for an agent/task type."""
+        prompt_file, cache_key = self._resolve_prompt(agent_type, task_type)
 
         # Check cache first (unless force reload)
         if not force_reload and cache_key in self.prompt_cache:
             cached_prompt = self.prompt_cache[cache_key]
-            if self._validate_checksum(prompt_file, cached_prompt.checksum):
+            if self._validate_file_signature(prompt_file, cached_prompt.file_signature):
                 # Move to end of cache (LRU)
-                self.prompt_cache.move_to_end(cache_key)
-                return cached_prompt.content
+                del self.prompt_cache[cache_key]
+                self.prompt_cache[cache_key] = cached_prompt
+                return cached_prompt
 
-        # Load and validate file
-        content = await self._read_and_validate_prompt(prompt_file)
-        checksum = self._calculate_checksum(prompt_file)
+        # Load and validate file, hashing the same bytes that were read
+        try:
+            content, checksum, file_signature = await self._read_and_validate_prompt(prompt_file)
+        except ConfigurationError:
+            # The file may have been removed; resolve it afresh next time
+            self._prompt_locations.pop((agent_type, task_type), None)
+            raise
 
         # Create system prompt object
         system_prompt = SystemPrompt(
@@ -190,14 +414,39 @@ class ContextManager:
             checksum=checksum,
             metadata={
                 "loaded_at": datetime.utcnow().isoformat(),
-                "file_size": prompt_file.stat().st_size
-            }
+                "file_size": file_signature[1]
+            },
+            file_signature=file_signature
         )
 
         # Update cache
         self._update_cache(cache_key, system_prompt)
 
-        return content
+        return system_prompt
+
+    def _resolve_prompt(
+        self,
+        agent_type: str,
+        task_type: Optional[str] = None
+    ) -> Tuple[Path, str]:
+        """Get the memoized (prompt file, cache key) for an agent/task type."""
+        key = (agent_type, task_type)
+        location = self._prompt_locations.get(key)
+        if location is None:
+            prompt_file = self._get_prompt_file(agent_type, task_type)
+            location = (prompt_file, self._get_cache_key(agent_type, task_type))
+            # Without a watcher nothing notices a task-specific prompt appearing
+            # later, so a fallback to the agent prompt is only memoized while watching
+            is_fallback = bool(task_type) and prompt_file.name == f"{agent_type}.md"
+            if self.watching or not is_fallback:
+                if len(self._prompt_locations) >= self.max_cache_size:
+                    self._prompt_locations.clear()
+                self._prompt_locations[key] = location
+        return location
+
+    def _invalidate_prompt_locations(self):
+        """Forget resolved prompt files after prompt files were added or removed."""
+        self._prompt_locations.clear()
 
     def _get_prompt_file(self, agent_type: str, task_type: Optional[str] = None) -> Path:
         """Get the file path for a prompt."""
@@ -224,13 +473,31 @@ class ContextManager:
             return f"{agent_type}:{task_type}"
         return agent_type
 
-    async def _read_and_validate_prompt(self, prompt_file: Path) -> str:
-        """Read and validate prompt content."""
+    async def _read_and_validate_prompt(
+        self,
+        prompt_file: Path
+    ) -> Tuple[str, str, Tuple[int, int]]:
+        """
+        Read and validate prompt content in a single pass over the file.
+
+        Returns:
+            Tuple of prompt content, SHA-256 checksum of the file and its
+            (st_mtime_ns, st_size) signature taken before reading
+        """
         try:
-            content = await asyncio.to_thread(prompt_file.read_text, encoding='utf-8')
+            data, file_signature = _read_prompt_file(prompt_file, _INLINE_READ_LIMIT)
+            if data is None:
+                # Large file: the worker owns the descriptor from open to close,
+                # so cancelling this load can't close it under a running read
+                data, file_signature = await asyncio.to_thread(_read_prompt_file, prompt_file)
+            content = data.decode('utf-8')
         except Exception as e:
             raise ConfigurationError(f"Failed to read prompt file {prompt_file}: {e}")
 
+        # Match read_text's universal newline handling
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
         # Validate content
         if not content.strip():
             raise ValidationError(f"Prompt file {prompt_file} is empty")
@@ -239,31 +506,33 @@ class ContextManager:
             raise ValidationError(f"Prompt file {prompt_file} content too short")
 
         # Basic content validation
-        required_sections = ["role", "capabilities"]
-        for section in required_sections:
-            if section not in content.lower():
+        lowered = content.lower()
+        for section in _REQUIRED_SECTIONS:
+            if section not in lowered:
                 raise ValidationError(
                     f"Prompt file {prompt_file} missing required section: {section}"
                 )
 
-        return content
+        return content, hashlib.sha256(data).hexdigest(), file_signature
 
-    def _calculate_checksum(self, prompt_file: Path) -> str:
-        """Calculate SHA-256 checksum of prompt file."""
+    def _file_signature(self, prompt_file: Path) -> Optional[Tuple[int, int]]:
+        """Get (st_mtime_ns, st_size) of prompt file."""
         try:
-            with open(prompt_file, 'rb') as f:
-                content = f.read()
-                return hashlib.sha256(content).hexdigest()
-        except Exception:
-            return ""
-
-    def _validate_checksum(self, prompt_file: Path, expected_checksum: str) -> bool:
-        """Validate file checksum matches expected value."""
-        if not expected_checksum:
+            stat = prompt_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _validate_file_signature(
+        self,
+        prompt_file: Path,
+        expected_signature: Optional[Tuple[int, int]]
+    ) -> bool:
+        """Validate file is unchanged since it was read, without re-reading it."""
+        if not expected_signature:
             return False
 
-        current_checksum = self._calculate_checksum(prompt_file)
-        return current_checksum == expected_checksum
+        return self._file_signature(prompt_file) == expected_signature
 
     def _update_cache(self, cache_key: str, system_prompt: SystemPrompt):
         """Update prompt cache with LRU eviction."""
@@ -276,7 +545,7 @@ class ContextManager:
 
         # Evict oldest entries if cache is full
         while len(self.prompt_cache) > self.max_cache_size:
-            self.prompt_cache.popitem(last=False)
+            del self.prompt_cache[next(iter(self.prompt_cache))]
 
     async def prepare_context(
         self,
@@ -296,284 +565,161 @@ class ContextManager:
             AgentContext object with all necessary context
         """
         # Load system prompt
-        system_prompt = await self.load_prompt(
+        system_prompt = await self._load_system_prompt(
             agent_type=task_spec.agent_type,
             task_type=task_spec.task_type
         )
 
+        # Calculate context hash for caching
+        context_hash = self._calculate_context_hash(system_prompt.checksum, task_spec.task_id)
+
+        # Without caller-supplied history or MCP data a context depends only on
+        # the prompt version and the task, so retries can reuse it
+        reusable = not history and not mcp_context
+        if reusable:
+            cached_context = self.context_cache.get(context_hash)
+            if cached_context is not None and cached_context.task_spec is task_spec:
+                # Move to end of cache (LRU)
+                del self.context_cache[context_hash]
+                self.context_cache[context_hash] = cached_context
+                # Fresh mutable fields, so one attempt's changes don't reach the next
+                return replace(
+                    cached_context,
+                    history=[],
+                    mcp_context={},
+                    metadata=self._new_context_metadata()
+                )
+
         # Prepare context
         context = AgentContext(
-            system_prompt=system_prompt,
+            system_prompt=system_prompt.content,
             history=history or [],
             mcp_context=mcp_context or {},
             task_spec=task_spec,
-            metadata={
-                "prepared_at": datetime.utcnow().isoformat(),
-                "context_version": "1.0.0"
-            }
+            metadata=self._new_context_metadata(),
+            context_hash=context_hash
         )
 
-        # Calculate context hash for caching
-        context.context_hash = self._calculate_context_hash(context)
+        if reusable:
+            self._update_context_cache(context_hash, context)
 
         return context
 
-    def _calculate_context_hash(self, context: AgentContext) -> str:
-        """Calculate hash for context caching."""
-        content = f"{context.system_prompt}:{context.task_spec.task_id}"
+    def _new_context_metadata(self) -> Dict[str, Any]:
+        """Create the metadata for a newly prepared context."""
+        return {
+            "prepared_at": datetime.utcnow().isoformat(),
+            "context_version": "1.0.0"
+        }
+
+    def _calculate_context_hash(self, prompt_checksum: str, task_id: str) -> str:
+        """Calculate hash for context caching from the prompt checksum and task ID."""
+        content = f"{prompt_checksum}:{task_id}"
         return hashlib.md5(content.encode()).hexdigest()
 
+    def _update_context_cache(self, context_hash: str, context: AgentContext):
+        """Update context cache with LRU eviction."""
+        # Remove existing entry if present
+        if context_hash in self.context_cache:
+            del self.context_cache[context_hash]
+
+        # Add new entry
+        self.context_cache[context_hash] = context
+
+        # Evict oldest entries if cache is full
+        while len(self.context_cache) > self.max_cache_size:
+            del self.context_cache[next(iter(self.context_cache))]
+
     async def _load_all_prompts(self):
         """Load all prompt files into cache."""
         if not self.prompts_dir.exists():
             return
 
-        prompt_files = list(self.prompts_dir.glob("*.md"))
-
+        # One scandir pass; load_prompt takes its own fstat when reading
+        with os.scandir(self.prompts_dir) as entries:
+            prompt_files = [
+                entry.name for entry in entries
+                if entry.name.endswith(".md")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+
+        # Small prompts are read inline; gathering lets reads of large ones
+        # overlap in worker threads and keeps one bad file from stopping the rest
+        loads = []
         for prompt_file in prompt_files:
-            try:
-                # Extract agent type and task type from filename
-                parts = prompt_file.stem.split("_")
-                agent_type = parts[0]
-                task_type = parts[1] if len(parts) > 1 else None
+            # Extract agent type and task type from filename
+            agent_type, task_type = _parse_prompt_stem(prompt_file[:-3])
+            loads.append(self.load_prompt(agent_type, task_type))
 
-                await self.load_prompt(agent_type, task_type)
-                logger.info(f"Loaded prompt: {prompt_file.name}")
+        results = await asyncio.gather(*loads, return_exceptions=True)
 
-            except Exception as e:
-                logger.error(f"Failed to load prompt {prompt_file}: {e}")
+        for prompt_file, result in zip(prompt_files, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load prompt %s: %s", prompt_file, result)
+            else:
+                logger.info("Loaded prompt: %s", prompt_file)
 
-    def _start_file_watching(self):
+    def _start_file_watching(self, native: bool = True):
         """Start watching prompt files for changes."""
         if self.watching:
             return
 
         try:
-            self.file_watcher = FileWatcher(self)
+            # Native events where available, polling otherwise
+            if native and ASYNCINOTIFY_AVAILABLE:
+                self.file_watcher = InotifyFileWatcher(self)
+            else:
+                self.file_watcher = FileWatcher(self)
             self.file_watcher.start_watching(self.prompts_dir)
             self.watching = True
-            logger.info(f"Started watching prompt directory: {self.prompts_dir}")
+            logger.info("Started watching prompt directory: %s", self.prompts_dir)
 
         except Exception as e:
-            logger.error(f"Failed to start file watching: {e}")
+            logger.error("Failed to start file watching: %s", e)
+
+    def _fall_back_to_polling(self):
+        """Replace a failed native watcher with the polling FileWatcher."""
+        self.watching = False
+        self.file_watcher = None
+        self._start_file_watching(native=False)
 
     async def _reload_prompt_file(self, file_path: str):
         """Reload a specific prompt file."""
         try:
             prompt_path = Path(file_path)
-            parts = prompt_path.stem.split("_")
-            agent_type = parts[0]
-            task_type = parts[1] if len(parts) > 1 else None
+            agent_type, task_type = _parse_prompt_stem(prompt_path.stem)
 
             cache_key = self._get_cache_key(agent_type, task_type)
 
+            # The file may be new, so prompts may now resolve to it
+            self._invalidate_prompt_locations()
+
             # Remove from cache to force reload
             if cache_key in self.prompt_cache:
                 del self.prompt_cache[cache_key]
 
             # Reload prompt
             await self.load_prompt(agent_type, task_type, force_reload=True)
-            logger.info(f"Reloaded prompt: {prompt_path.name}")
+            logger.info("Reloaded prompt: %s", prompt_path.name)
 
         except Exception as e:
-            logger.error(f"Failed to reload prompt {file_path}: {e}")
+            logger.error("Failed to reload prompt %s: %s", file_path, e)
 
     def _initialize_default_prompts(self):
         """Initialize default prompt files if directory is empty."""
         if any(self.prompts_dir.glob("*.md")):
             return
 
-        default_prompts = {
-            "team_leader.md": self._get_team_leader_prompt(),
-            "research_agent.md": self._get_research_agent_prompt(),
-            "codebase_analyzer.md": self._get_codebase_analyzer_prompt(),
-            "frontend_coder.md": self._get_frontend_coder_prompt(),
-            "backend_coder.md": self._get_backend_coder_prompt(),
-        }
-
-        for filename, content in default_prompts.items():
+        # Copied as bytes from package data, so no decode/encode round trip
+        default_prompts = importlib.resources.files("ai_agent_sdk") / "resources" / "prompts"
+        for filename in _DEFAULT_PROMPT_FILES:
             prompt_file = self.prompts_dir / filename
             try:
-                prompt_file.write_text(content, encoding='utf-8')
-                logger.info(f"Created default prompt: {filename}")
+                prompt_file.write_bytes(default_prompts.joinpath(filename).read_bytes())
+                logger.info("Created default prompt: %s", filename)
             except Exception as e:
-                logger.error(f"Failed to create default prompt {filename}: {e}")
-
-    def _get_team_leader_prompt(self) -> str:
-        """Get default team leader prompt."""
-        return """# TeamLeader Agent - Orchestration Specialist
-
-You are the TeamLeader agent, responsible for coordinating specialized AI agents through a structured development process. Your expertise includes:
-
-## Core Capabilities
-- Hierarchical multi-agent coordination and orchestration
-- Ten-phase development process management
-- Task delegation and scope validation
-- Context preparation and result validation
-
-## Programmatic Rules Engine
-You enforce a structured development process with the following phases:
-1. Initialization - System setup and configuration
-2. Research Collection & Synthesis - Information gathering
-3. Plan - Architecture and implementation planning
-4. Context Preparation - Context assembly and validation
-5. Validate - Risk assessment and scope checking
-6. Implement - Functional development with no mocks
-7. Verify - Independent verification and quality checks
-8. Test - Comprehensive testing with mock detection
-9. User Value Validation - Final validation against requirements
-10. Document - Documentation creation and next part preparation
-
-## Task Delegation Process
-1. Validate task against current phase and scope boundaries
-2. Select appropriate specialized agent
-3. Prepare comprehensive context with system prompts
-4. Monitor execution and collect results
-5. Validate results and update system state
-
-## Quality Standards
-- Zero tolerance for mock data or placeholder implementations
-- Ensure all code is immediately executable and verifiable
-- Maintain comprehensive audit trails
-- Enforce scope boundaries and complexity limits
-
-## Current Task
-Focus on coordinating agent tasks according to the ten-phase process, ensuring quality and scope compliance.
-"""
-
-    def _get_research_agent_prompt(self) -> str:
-        """Get default research agent prompt."""
-        return """# Research Agent - Knowledge Synthesis Specialist
-
-You are a specialized research agent focused on comprehensive research and knowledge synthesis. Your expertise includes:
-
-## Core Capabilities
-- Comprehensive market research and competitive intelligence
-- Multi-source information gathering and verification
-- Knowledge synthesis and trend analysis
-- Source attribution and confidence scoring
-
-## Research Methodology
-1. **Multi-source Research**: Gather information from diverse, credible sources
-2. **Source Verification**: Cross-reference findings across multiple sources
-3. **Trend Analysis**: Identify patterns and trends in the data
-4. **Knowledge Synthesis**: Combine findings into actionable insights
-
-## Quality Standards
-- Always provide source attribution with credibility scores
-- Include confidence scoring for all findings
-- Highlight assumptions and limitations
-- Ensure recommendations are data-driven and evidence-based
-
-## Integration Capabilities
-- Perplexity MCP server integration for enhanced research
-- Fallback mechanisms for research service failures
-- Local research capabilities when external services unavailable
-
-## Current Task
-Focus on conducting thorough research with proper source attribution and confidence scoring.
-"""
-
-    def _get_codebase_analyzer_prompt(self) -> str:
-        """Get default codebase analyzer prompt."""
-        return """# CodeBase Analyzer - Code Intelligence Specialist
-
-You are a specialized codebase analyzer focused on comprehensive code analysis and intelligence. Your expertise includes:
-
-## Core Capabilities
-- Security vulnerability scanning and assessment
-- Performance analysis and bottleneck identification
-- Architecture review and pattern recognition
-- Dependency mapping and impact analysis
-
-## Analysis Methodology
-1. **Comprehensive Scanning**: Analyze code structure, patterns, and dependencies
-2. **Security Assessment**: Identify vulnerabilities and security risks
-3. **Performance Evaluation**: Assess performance characteristics and bottlenecks
-4. **Architecture Review**: Evaluate design patterns and architectural decisions
-
-## Quality Standards
-- Provide detailed findings with actionable recommendations
-- Include severity assessments and priority rankings
-- Support analysis with code examples and best practices
-- Ensure findings are practical and implementable
-
-## Integration Capabilities
-- Serena MCP server integration for enhanced code analysis
-- Local analysis tools and pattern matching
-- Support for multiple programming languages and frameworks
-
-## Current Task
-Focus on thorough code analysis with detailed findings and actionable recommendations.
-"""
-
-    def _get_frontend_coder_prompt(self) -> str:
-        """Get default frontend coder prompt."""
-        return """# Frontend Coder - UI/UX Development Specialist
-
-You are a specialized frontend developer focused on creating modern, responsive user interfaces. Your expertise includes:
-
-## Core Capabilities
-- Modern frontend framework development (React, Vue, Angular)
-- Responsive design and mobile-first development
-- Component-based architecture and reusability
-- Performance optimization and user experience
-
-## Development Standards
-1. **Modern Frameworks**: Use current best practices and patterns
-2. **Responsive Design**: Ensure compatibility across devices
-3. **Component Architecture**: Build reusable, maintainable components
-4. **Performance**: Optimize for fast loading and smooth interactions
-
-## Quality Standards
-- Write clean, maintainable, and well-documented code
-- Follow accessibility standards (WCAG 2.1 AA)
-- Ensure cross-browser compatibility
-- Implement proper error handling and validation
-
-## Technology Stack
-- HTML5, CSS3, JavaScript/TypeScript
-- Modern frontend frameworks
-- Build tools and development environments
-- Testing frameworks and CI/CD integration
-
-## Current Task
-Focus on creating high-quality, production-ready frontend components with modern best practices.
-"""
-
-    def _get_backend_coder_prompt(self) -> str:
-        """Get default backend coder prompt."""
-        return """# Backend Coder - Server-Side Development Specialist
-
-You are a specialized backend developer focused on creating robust, scalable server-side applications. Your expertise includes:
-
-## Core Capabilities
-- RESTful API design and implementation
-- Database design and optimization
-- Authentication and authorization systems
-- Microservices architecture and integration
-
-## Development Standards
-1. **API Design**: RESTful principles with proper HTTP methods
-2. **Database Design**: Normalized schemas with proper indexing
-3. **Security**: Authentication, authorization, and data protection
-4. **Performance**: Optimized queries and caching strategies
-
-## Quality Standards
-- Write clean, maintainable, and testable code
-- Implement comprehensive error handling and logging
-- Follow security best practices
-- Ensure scalability and performance optimization
-
-## Technology Stack
-- Python/Node.js with modern frameworks
-- Relational and NoSQL databases
-- Containerization and orchestration
-- Cloud services and deployment platforms
-
-## Current Task
-Focus on creating robust, secure, and scalable backend APIs with proper testing and documentation.
-"""
+                logger.error("Failed to create default prompt %s: %s", filename, e)
 
     async def cleanup(self):
         """Cleanup resources and stop file watching."""
@@ -6,13 +6,19 @@ development process with validation gates and scope enforcement.
 """
 
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+import logging
+import sys
+import time
+from collections import deque
+from functools import partial
+from typing import Callable, Deque, Dict, List, Optional, Set, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .exceptions import ScopeViolationError, ConfigurationError
 
+logger = logging.getLogger(__name__)
+
 
 class Phase(Enum):
     """Development phases in the ten-phase process."""
@@ -28,6 +34,18 @@ class Phase(Enum):
     DOCUMENTATION = "documentation"
     PREPARATION = "preparation"
 
+    # Members compare by identity, so identity hashing is consistent and
+    # avoids Enum's Python-level __hash__ on every phase_configs lookup
+    __hash__ = object.__hash__
+
+
+# Phase members by value, for config lookups without Enum.__call__
+_PHASE_BY_VALUE: Dict[str, Phase] = {phase.value: phase for phase in Phase}
+
+# Phases in process order, and each phase's successor (the last has none)
+_PHASE_ORDER = tuple(Phase)
+_NEXT_PHASE: Dict[Phase, Phase] = dict(zip(_PHASE_ORDER, _PHASE_ORDER[1:]))
+
 
 @dataclass
 class PhaseConfig:
@@ -37,6 +55,8 @@ class PhaseConfig:
     completion_criteria: List[str]
     max_complexity: int
     timeout_seconds: int
+    # One bound requirement check per completion criterion, built at load
+    verifiers: Tuple[Callable[[], bool], ...] = field(default=(), repr=False, compare=False)
 
 
 @dataclass
@@ -51,6 +71,14 @@ class TaskSpec:
     project_id: Optional[str] = None
     metadata: Dict[str, Any] = None
 
+    def __post_init__(self):
+        # Intern the type names so dispatch-table and task-type set lookups
+        # match the interned literals by identity
+        if isinstance(self.agent_type, str):
+            self.agent_type = sys.intern(self.agent_type)
+        if isinstance(self.task_type, str):
+            self.task_type = sys.intern(self.task_type)
+
 
 class RulesEngine:
     """
@@ -67,10 +95,16 @@ class RulesEngine:
         self.current_complexity_used = 0
         self.phase_configs = self._load_phase_configs()
         self.agent_registry: Dict[str, Set[str]] = {}
-        self.task_history: List[Dict[str, Any]] = []
+        # Only the most recent entries are kept; tasks_completed counts them all
+        self.task_history: Deque[Dict[str, Any]] = deque(
+            maxlen=rules_config.get("history_cap", 10000)
+        )
+        self.tasks_completed = 0
+        # Last get_phase_status result; None once state has changed
+        self._status_cache: Optional[Dict[str, Any]] = None
 
         # Add phases attribute for backward compatibility
-        self.phases = list(Phase)
+        self.phases = list(_PHASE_ORDER)
     def _load_phase_configs(self) -> Dict[Phase, PhaseConfig]:
         """Load phase configurations from rules config."""
         default_configs = {
@@ -156,17 +190,23 @@ class RulesEngine:
         # Override with custom configs if provided
         custom_configs = self.config.get("phases", {})
         for phase_name, config in custom_configs.items():
-            try:
-                phase_enum = Phase(phase_name.lower())
-                default_configs[phase_enum] = PhaseConfig(
-                    name=config.get("name", phase_name),
-                    allowed_tasks=set(config.get("allowed_tasks", [])),
-                    completion_criteria=config.get("completion_criteria", []),
-                    max_complexity=config.get("max_complexity", 5),
-                    timeout_seconds=config.get("timeout_seconds", 600)
-                )
-            except ValueError:
+            phase_enum = _PHASE_BY_VALUE.get(phase_name.lower())
+            if phase_enum is None:
                 raise ConfigurationError(f"Invalid phase name: {phase_name}")
+            default_configs[phase_enum] = PhaseConfig(
+                name=config.get("name", phase_name),
+                allowed_tasks=set(config.get("allowed_tasks", [])),
+                completion_criteria=config.get("completion_criteria", []),
+                max_complexity=config.get("max_complexity", 5),
+                timeout_seconds=config.get("timeout_seconds", 600)
+            )
+
+        # Compile completion criteria into requirement checks once
+        for phase_config in default_configs.values():
+            phase_config.verifiers = tuple(
+                partial(self._check_requirement, criterion)
+                for criterion in phase_config.completion_criteria
+            )
 
         return default_configs
 
@@ -183,36 +223,42 @@ class RulesEngine:
         Raises:
             ScopeViolationError: If task exceeds scope boundaries
         """
+        current_phase = self.current_phase
+        phase_config = self.phase_configs[current_phase]
+        task_type = task_spec.task_type
+        complexity = task_spec.complexity
+
         # Check phase-appropriate tasks
-        phase_config = self.phase_configs[self.current_phase]
-        if task_spec.task_type not in phase_config.allowed_tasks:
+        if task_type not in phase_config.allowed_tasks:
             raise ScopeViolationError(
-                f"Task type '{task_spec.task_type}' not allowed in phase "
-                f"'{self.current_phase.value}'. Allowed tasks: "
+                f"Task type '{task_type}' not allowed in phase "
+                f"'{current_phase.value}'. Allowed tasks: "
                 f"{phase_config.allowed_tasks}"
             )
 
         # Check complexity budget
-        if self.current_complexity_used + task_spec.complexity > self.complexity_budget:
+        used = self.current_complexity_used
+        budget = self.complexity_budget
+        if used + complexity > budget:
             raise ScopeViolationError(
-                f"Task complexity {task_spec.complexity} exceeds remaining budget. "
-                f"Current used: {self.current_complexity_used}, "
-                f"Budget: {self.complexity_budget}, "
-                f"Remaining: {self.complexity_budget - self.current_complexity_used}"
+                f"Task complexity {complexity} exceeds remaining budget. "
+                f"Current used: {used}, "
+                f"Budget: {budget}, "
+                f"Remaining: {budget - used}"
             )
 
         # Check task complexity against phase limits
-        if task_spec.complexity > phase_config.max_complexity:
+        if complexity > phase_config.max_complexity:
             raise ScopeViolationError(
-                f"Task complexity {task_spec.complexity} exceeds phase maximum "
-                f"of {phase_config.max_complexity} for phase {self.current_phase.value}"
+                f"Task complexity {complexity} exceeds phase maximum "
+                f"of {phase_config.max_complexity} for phase {current_phase.value}"
             )
 
         # Check agent availability
         if not self._agent_available(task_spec.agent_type):
             raise ScopeViolationError(
                 f"Agent type '{task_spec.agent_type}' not available for task "
-                f"'{task_spec.task_type}'"
+                f"'{task_type}'"
             )
 
         return True
@@ -242,28 +288,24 @@ class RulesEngine:
 
         # Check current phase completion criteria
         current_config = self.phase_configs[self.current_phase]
-        for criterion in current_config.completion_criteria:
-            if not self._check_requirement(criterion):
+        for verify in current_config.verifiers:
+            if not verify():
                 return False
 
         return True
 
     def _get_next_phase(self, current_phase: Phase) -> Optional[Phase]:
         """Get the next phase in the sequence."""
-        phase_order = list(Phase)
-        current_index = phase_order.index(current_phase)
-
-        if current_index < len(phase_order) - 1:
-            return phase_order[current_index + 1]
-
-        return None
+        return _NEXT_PHASE.get(current_phase)
 
     def _check_requirement(self, requirement: str) -> bool:
         """
         Check if a specific requirement is met.
 
         In a real implementation, this would check actual system state,
-        task completion, validation results, etc.
+        task completion, validation results, etc. Overrides that depend on
+        state outside the engine should call _invalidate_status_cache when
+        that state changes.
         """
         # For now, return True - in real implementation, check actual requirements
         return True
@@ -282,26 +324,36 @@ class RulesEngine:
             return False
 
         # Update phase history and current phase
-        self.phase_history.append(self.current_phase)
+        from_phase = self.current_phase
+        self.phase_history.append(from_phase)
         self.current_phase = target_phase
+        self._invalidate_status_cache()
 
         # Log phase progression
-        self._log_phase_progression(self.current_phase, target_phase)
+        self._log_phase_progression(from_phase, target_phase)
 
         return True
 
     def _log_phase_progression(self, from_phase: Phase, to_phase: Phase):
         """Log phase progression for audit purposes."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         progression_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "from_phase": from_phase.value,
             "to_phase": to_phase.value,
             "complexity_used": self.current_complexity_used,
-            "task_count": len(self.task_history)
+            "task_count": self.tasks_completed
         }
 
         # In a real implementation, this would be logged to audit system
-        print(f"Phase progression: {from_phase.value} -> {to_phase.value}")
+        logger.info(
+            "Phase progression: %s -> %s",
+            from_phase.value,
+            to_phase.value,
+            extra={"phase_progression": progression_entry}
+        )
 
     def register_task_execution(self, task_spec: TaskSpec, result: Dict[str, Any]):
         """Register task execution for tracking."""
@@ -313,44 +365,59 @@ class RulesEngine:
             "task_type": task_spec.task_type,
             "complexity": task_spec.complexity,
             "phase": self.current_phase.value,
-            "timestamp": datetime.utcnow().isoformat(),
+            # Epoch nanoseconds; format only when exported
+            "timestamp_ns": time.time_ns(),
             "result": result
         }
 
         self.task_history.append(task_entry)
+        self.tasks_completed += 1
+        self._invalidate_status_cache()
 
     def get_phase_status(self) -> Dict[str, Any]:
         """Get current phase status and metrics."""
+        if self._status_cache is None:
+            self._status_cache = self._build_phase_status()
+        return dict(self._status_cache)
+
+    def _build_phase_status(self) -> Dict[str, Any]:
+        """Build the phase status returned by get_phase_status."""
         phase_config = self.phase_configs[self.current_phase]
 
+        # The last phase has no successor, so there is nothing to progress to
+        next_phase = self._get_next_phase(self.current_phase)
+        can_progress = next_phase is not None and self.can_progress_to_phase(next_phase)
+
         return {
             "current_phase": self.current_phase.value,
             "phase_name": phase_config.name,
             "complexity_budget": self.complexity_budget,
             "complexity_used": self.current_complexity_used,
             "complexity_remaining": self.complexity_budget - self.current_complexity_used,
-            "tasks_completed": len(self.task_history),
+            "tasks_completed": self.tasks_completed,
             "phase_progress": self._calculate_phase_progress(),
-            "can_progress": self.can_progress_to_phase(self._get_next_phase(self.current_phase) or self.current_phase)
+            "can_progress": can_progress
         }
 
     def _calculate_phase_progress(self) -> float:
         """Calculate progress percentage for current phase."""
-        current_config = self.phase_configs[self.current_phase]
-        completed_criteria = sum(
-            1 for criterion in current_config.completion_criteria
-            if self._check_requirement(criterion)
-        )
-
-        if not current_config.completion_criteria:
+        verifiers = self.phase_configs[self.current_phase].verifiers
+        if not verifiers:
             return 0.0
 
-        return completed_criteria / len(current_config.completion_criteria)
+        completed_criteria = sum(1 for verify in verifiers if verify())
+        return completed_criteria / len(verifiers)
 
     def reset_complexity_budget(self):
         """Reset complexity budget (for new project/part)."""
         self.current_complexity_used = 0
         self.task_history.clear()
+        self.tasks_completed = 0
+        self._invalidate_status_cache()
+
+    def _invalidate_status_cache(self):
+        """Drop the cached phase status after engine state changes."""
+        self._status_cache = None
 
     def add_agent_capability(self, agent_type: str, task_types: Set[str]):
         """Add agent capability to registry."""
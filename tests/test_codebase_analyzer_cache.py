@@ -0,0 +1,85 @@
+"""
+Tests for the CodeBaseAnalyzer per-file architecture cache.
+"""
+
+import pytest
+
+from ai_agent_sdk.agents import codebase_analyzer
+from ai_agent_sdk.agents.codebase_analyzer import CodeBaseAnalyzer
+
+SOURCE = "class Widget:\n    def render(self):\n        return 1\n"
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Record the paths the architecture passes actually run over."""
+    paths = []
+    analyze = codebase_analyzer._analyze_architecture_file
+
+    def recording_analyze(file_path, content):
+        paths.append(file_path)
+        return analyze(file_path, content)
+
+    monkeypatch.setattr(codebase_analyzer, "_analyze_architecture_file", recording_analyze)
+    return paths
+
+
+async def test_unchanged_file_is_served_from_cache(tmp_path, analyzed):
+    source = tmp_path / "widget.py"
+    source.write_text(SOURCE, encoding="utf-8")
+    analyzer = CodeBaseAnalyzer()
+
+    first = await analyzer._analyze_architecture_files([source])
+    second = await analyzer._analyze_architecture_files([source])
+
+    assert analyzed == [str(source)]
+    assert second == first
+
+
+async def test_changed_file_is_analyzed_again(tmp_path, analyzed):
+    source = tmp_path / "widget.py"
+    source.write_text(SOURCE, encoding="utf-8")
+    analyzer = CodeBaseAnalyzer()
+
+    first = await analyzer._analyze_architecture_files([source])
+    source.write_text(SOURCE + "import os\n", encoding="utf-8")
+    second = await analyzer._analyze_architecture_files([source])
+
+    assert analyzed == [str(source), str(source)]
+    assert "os" not in first[source][1]
+    assert "os" in second[source][1]
+
+
+async def test_unreadable_file_is_dropped_and_not_cached(tmp_path, analyzed):
+    good = tmp_path / "good.py"
+    good.write_text(SOURCE, encoding="utf-8")
+    bad = tmp_path / "bad.py"
+    bad.write_bytes(b"x = '\xff\xfe'\n")
+    analyzer = CodeBaseAnalyzer()
+
+    results = await analyzer._analyze_architecture_files([bad, good])
+
+    assert list(results) == [good]
+    assert str(bad) not in analyzer.architecture_cache
+    assert analyzed == [str(good)]
+
+
+async def test_cache_evicts_least_recently_used_files(tmp_path, analyzed):
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.py"
+        path.write_text(SOURCE, encoding="utf-8")
+        paths.append(path)
+    a, b, c = paths
+    analyzer = CodeBaseAnalyzer({"max_cache_size": 2})
+
+    await analyzer._analyze_architecture_files([a, b])
+    # Touch "a" so "b" becomes the least recently used entry
+    await analyzer._analyze_architecture_files([a])
+    await analyzer._analyze_architecture_files([c])
+
+    assert list(analyzer.architecture_cache) == [str(a), str(c)]
+
+    analyzed.clear()
+    await analyzer._analyze_architecture_files([a, b, c])
+    assert analyzed == [str(b)]
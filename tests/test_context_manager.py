@@ -0,0 +1,103 @@
+"""
+Tests for ContextManager prompt resolution and caching.
+"""
+
+import asyncio
+
+import pytest
+
+from ai_agent_sdk.core.context_manager import ContextManager, FileWatcher
+from ai_agent_sdk.core.rules_engine import TaskSpec
+
+PROMPT = "# Demo\n## Role\nReviewer\n## Capabilities\n" + "c" * 60 + "\n"
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "demo.md").write_text(PROMPT, encoding="utf-8")
+    return tmp_path
+
+
+async def test_new_task_prompt_is_used_without_a_watcher(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    assert not manager.watching
+
+    assert "override" not in await manager.load_prompt("demo", "other")
+
+    (prompts_dir / "demo_other.md").write_text(PROMPT + "override\n", encoding="utf-8")
+    assert "override" in await manager.load_prompt("demo", "other")
+
+
+async def test_reload_picks_up_a_new_task_prompt(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    # Behave as if a watcher were running, so fallback resolutions are memoized
+    manager.watching = True
+
+    assert "override" not in await manager.load_prompt("demo", "other")
+
+    task_prompt = prompts_dir / "demo_other.md"
+    task_prompt.write_text(PROMPT + "override\n", encoding="utf-8")
+    await manager._reload_prompt_file(str(task_prompt))
+
+    assert "override" in await manager.load_prompt("demo", "other")
+
+
+async def test_reused_context_does_not_share_mutable_state(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    task_spec = TaskSpec("t1", "demo", "review", "Review the change", 3, 1, metadata={})
+
+    first = await manager.prepare_context(task_spec)
+    first.history.append({"role": "user", "content": "attempt one"})
+    first.mcp_context["server"] = "perplexity"
+    first.metadata["attempt"] = 1
+
+    second = await manager.prepare_context(task_spec)
+    assert second.context_hash == first.context_hash
+    assert second.system_prompt == first.system_prompt
+    assert second.history == []
+    assert second.mcp_context == {}
+    assert "attempt" not in second.metadata
+    assert second.metadata["prepared_at"] >= first.metadata["prepared_at"]
+
+
+async def test_stop_watching_cancels_running_reloads(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_reload(file_path):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(file_path)
+            raise
+
+    manager._reload_prompt_file = slow_reload
+    watcher = FileWatcher(manager, check_interval=0.02, debounce_delay=0.02)
+    watcher.start_watching(prompts_dir)
+    try:
+        await asyncio.sleep(0.1)
+        (prompts_dir / "demo.md").write_text(PROMPT + "edit\n", encoding="utf-8")
+        await asyncio.wait_for(started.wait(), timeout=3.0)
+        assert len(watcher._tasks) == 1
+    finally:
+        watcher.stop_watching()
+
+    await asyncio.sleep(0)
+    assert cancelled == [str(prompts_dir / "demo.md")]
+    assert not watcher._tasks
+
+
+async def test_cancelled_prompt_load_is_reported_as_failed(prompts_dir, caplog):
+    manager = ContextManager(str(prompts_dir))
+
+    async def cancelled_load(agent_type, task_type=None, force_reload=False):
+        raise asyncio.CancelledError()
+
+    manager.load_prompt = cancelled_load
+    with caplog.at_level("INFO", logger="ai_agent_sdk.core.context_manager"):
+        await manager._load_all_prompts()
+
+    assert "Failed to load prompt demo.md" in caplog.text
+    assert "Loaded prompt: demo.md" not in caplog.text
@@ -0,0 +1,96 @@
+"""
+Tests for the inotify-backed prompt file watcher.
+
+These run only on Linux with the optional asyncinotify package installed.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+pytest.importorskip("asyncinotify")
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+from ai_agent_sdk.core.context_manager import (  # noqa: E402
+    ContextManager,
+    FileWatcher,
+    InotifyFileWatcher,
+)
+
+PROMPT = "# Demo\n## Role\nReviewer\n## Capabilities\n" + "c" * 60 + "\n"
+
+
+async def _wait_for(predicate, timeout: float = 3.0):
+    """Poll predicate on the event loop until it holds or timeout expires."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.02)
+    return True
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "demo.md").write_text(PROMPT, encoding="utf-8")
+    return tmp_path
+
+
+async def test_inotify_watcher_reloads_once_per_burst(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    reloads = []
+    original_reload = manager._reload_prompt_file
+
+    async def record_reload(file_path):
+        reloads.append(file_path)
+        await original_reload(file_path)
+
+    manager._reload_prompt_file = record_reload
+    await manager.initialize()
+    try:
+        assert isinstance(manager.file_watcher, InotifyFileWatcher)
+        await asyncio.sleep(0.1)
+
+        prompt_file = prompts_dir / "demo.md"
+        for i in range(5):
+            prompt_file.write_text(PROMPT + f"edit {i}\n", encoding="utf-8")
+            await asyncio.sleep(0.02)
+
+        assert await _wait_for(lambda: reloads)
+        await asyncio.sleep(0.4)
+        assert reloads == [str(prompt_file)]
+        assert "edit 4" in await manager.load_prompt("demo")
+    finally:
+        await manager.cleanup()
+
+
+async def test_inotify_watcher_picks_up_new_task_prompt(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    await manager.initialize()
+    try:
+        assert "override" not in await manager.load_prompt("demo", "review")
+        await asyncio.sleep(0.1)
+
+        (prompts_dir / "demo_review.md").write_text(PROMPT + "override\n", encoding="utf-8")
+        deadline = asyncio.get_running_loop().time() + 3.0
+        while "override" not in await manager.load_prompt("demo", "review"):
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.02)
+    finally:
+        await manager.cleanup()
+
+
+async def test_inotify_failure_falls_back_to_polling(prompts_dir):
+    manager = ContextManager(str(prompts_dir))
+    # Watching a directory that no longer exists makes add_watch fail
+    manager.prompts_dir = prompts_dir / "missing"
+    await manager.initialize()
+    try:
+        assert await _wait_for(lambda: isinstance(manager.file_watcher, FileWatcher)
+                               and not isinstance(manager.file_watcher, InotifyFileWatcher))
+        assert manager.watching
+    finally:
+        await manager.cleanup()
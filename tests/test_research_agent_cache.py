@@ -0,0 +1,154 @@
+"""
+Tests for the ResearchAgent result cache.
+"""
+
+import pytest
+
+from ai_agent_sdk.agents import research_agent
+from ai_agent_sdk.agents.research_agent import ResearchAgent
+from ai_agent_sdk.core.context_manager import AgentContext
+from ai_agent_sdk.core.exceptions import MCPServerError
+from ai_agent_sdk.core.rules_engine import TaskSpec
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(research_agent.time, "monotonic", clock)
+    return clock
+
+
+def _make_agent(mcp_available: bool = True, **config):
+    agent = ResearchAgent(config)
+    agent.claude_calls = 0
+
+    async def fake_claude(messages, system_prompt=None):
+        agent.claude_calls += 1
+        return f"response {agent.claude_calls}"
+
+    async def fake_mcp(server_name, method, params):
+        if not mcp_available:
+            raise MCPServerError("Perplexity unavailable")
+        return {"results": {"sources": [{"url": f"https://example.com/{params['query']}"}]}}
+
+    agent._call_claude = fake_claude
+    agent._call_mcp_server = fake_mcp
+    return agent
+
+
+def _task(task: str = "rival products", task_type: str = "competitive_research",
+          task_id: str = "t1", project_id: str = None) -> TaskSpec:
+    return TaskSpec(task_id, "research", task_type, task, 5, 1, project_id=project_id, metadata={})
+
+
+def _context(system_prompt: str) -> AgentContext:
+    return AgentContext(system_prompt=system_prompt, history=[], mcp_context={}, task_spec=None)
+
+
+async def test_repeated_task_is_served_from_cache(clock):
+    agent = _make_agent()
+
+    first = await agent._execute_task_internal(_task(task_id="t1"), None)
+    second = await agent._execute_task_internal(_task(task_id="t2"), None)
+    other = await agent._execute_task_internal(_task("other products", task_id="t3"), None)
+
+    assert agent.claude_calls == 2
+    assert second.content == first.content
+    assert second.task_id == "t2"
+    assert other.content != first.content
+
+
+async def test_cached_result_expires_after_ttl(clock):
+    agent = _make_agent(research_cache_ttl=60)
+
+    await agent._execute_task_internal(_task(), None)
+    clock.now += 30
+    await agent._execute_task_internal(_task(), None)
+    assert agent.claude_calls == 1
+
+    clock.now += 61
+    await agent._execute_task_internal(_task(), None)
+    assert agent.claude_calls == 2
+
+
+async def test_least_recently_used_result_is_evicted(clock):
+    agent = _make_agent(research_cache_size=2)
+
+    await agent._execute_task_internal(_task("a"), None)
+    await agent._execute_task_internal(_task("b"), None)
+    # Touch "a" so "b" becomes the least recently used entry
+    await agent._execute_task_internal(_task("a"), None)
+    await agent._execute_task_internal(_task("c"), None)
+    assert agent.claude_calls == 3
+    assert len(agent.research_cache) == 2
+
+    await agent._execute_task_internal(_task("a"), None)
+    assert agent.claude_calls == 3
+    await agent._execute_task_internal(_task("b"), None)
+    assert agent.claude_calls == 4
+
+
+async def test_zero_cache_size_disables_caching(clock):
+    agent = _make_agent(research_cache_size=0)
+
+    await agent._execute_task_internal(_task(), None)
+    await agent._execute_task_internal(_task(), None)
+
+    assert agent.claude_calls == 2
+    assert not agent.research_cache
+
+
+@pytest.mark.parametrize("task_type", ["competitive_research", "knowledge_synthesis", "trend_analysis"])
+async def test_fallback_results_are_not_cached(clock, task_type):
+    agent = _make_agent(mcp_available=False)
+
+    first = await agent._execute_task_internal(_task(task_type=task_type), None)
+    await agent._execute_task_internal(_task(task_type=task_type), None)
+
+    assert first.metadata["fallback_used"]
+    assert agent.claude_calls == 2
+    assert not agent.research_cache
+
+
+async def test_mutating_a_result_does_not_change_the_cache(clock):
+    agent = _make_agent()
+
+    first = await agent._execute_task_internal(_task(), None)
+    first.sources.append("https://example.com/injected")
+    first.metadata["perplexity_data"]["results"]["sources"].clear()
+    first.metadata["extra"] = True
+
+    second = await agent._execute_task_internal(_task(), None)
+    second.sources.clear()
+
+    third = await agent._execute_task_internal(_task(), None)
+    assert agent.claude_calls == 1
+    assert third.sources == ["https://example.com/rival products"]
+    assert third.metadata["perplexity_data"]["results"]["sources"]
+    assert "extra" not in third.metadata
+
+
+async def test_project_and_system_prompt_are_part_of_the_key(clock):
+    agent = _make_agent()
+
+    await agent._execute_task_internal(_task(project_id="alpha"), None)
+    await agent._execute_task_internal(_task(project_id="beta"), None)
+    assert agent.claude_calls == 2
+
+    await agent._execute_task_internal(_task(project_id="alpha"), _context("prompt one"))
+    await agent._execute_task_internal(_task(project_id="alpha"), _context("prompt two"))
+    assert agent.claude_calls == 4
+
+    await agent._execute_task_internal(_task(project_id="alpha"), _context("prompt one"))
+    await agent._execute_task_internal(_task(project_id="alpha"), None)
+    assert agent.claude_calls == 4
@@ -0,0 +1,68 @@
+"""
+Tests for RulesEngine phase status caching.
+"""
+
+from ai_agent_sdk.core.rules_engine import Phase, RulesEngine, TaskSpec
+
+
+def _task(task_id: str = "t1", complexity: int = 3) -> TaskSpec:
+    return TaskSpec(task_id, "research", "market_research", "Size the market", complexity, 1, metadata={})
+
+
+def test_repeated_status_is_served_from_cache():
+    engine = RulesEngine({})
+
+    first = engine.get_phase_status()
+    assert engine._status_cache is not None
+    assert engine.get_phase_status() == first
+
+
+async def test_progress_to_phase_refreshes_status():
+    engine = RulesEngine({})
+    assert engine.get_phase_status()["current_phase"] == "initialization"
+
+    assert await engine.progress_to_phase(Phase.RESEARCH)
+
+    status = engine.get_phase_status()
+    assert status["current_phase"] == "research"
+    assert status["phase_name"] == engine.phase_configs[Phase.RESEARCH].name
+
+
+def test_register_task_execution_refreshes_status():
+    engine = RulesEngine({"complexity_budget": 20})
+    engine.get_phase_status()
+
+    engine.register_task_execution(_task("t1", 3), {"status": "completed"})
+    engine.register_task_execution(_task("t2", 4), {"status": "completed"})
+
+    status = engine.get_phase_status()
+    assert status["tasks_completed"] == 2
+    assert status["complexity_used"] == 7
+    assert status["complexity_remaining"] == 13
+
+
+def test_reset_complexity_budget_refreshes_status():
+    engine = RulesEngine({"complexity_budget": 20})
+    engine.register_task_execution(_task(), {"status": "completed"})
+    assert engine.get_phase_status()["tasks_completed"] == 1
+
+    engine.reset_complexity_budget()
+
+    status = engine.get_phase_status()
+    assert status["tasks_completed"] == 0
+    assert status["complexity_used"] == 0
+    assert status["complexity_remaining"] == 20
+
+
+def test_mutating_returned_status_does_not_change_cache():
+    engine = RulesEngine({})
+
+    status = engine.get_phase_status()
+    status["current_phase"] = "documentation"
+    status["tasks_completed"] = 99
+    status["extra"] = True
+
+    fresh = engine.get_phase_status()
+    assert fresh["current_phase"] == "initialization"
+    assert fresh["tasks_completed"] == 0
+    assert "extra" not in fresh